@@ -0,0 +1,184 @@
+"""
+Regroupement asynchrone des requêtes vers l'API Grist.
+
+Ce module fournit un répartiteur qui fusionne les soumissions concurrentes
+portant sur un même endpoint en un seul appel HTTP, puis redistribue
+le résultat à chaque appelant dans l'ordre de soumission.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+# Configurer le logger
+logger = logging.getLogger("grist_mcp_server")
+
+# Fonction d'envoi : reçoit la liste fusionnée, retourne la liste des résultats (ou None)
+SendFunc = Callable[[List[Any]], Awaitable[Optional[List[Any]]]]
+
+# Indique si l'échec d'un lot autorise son rejeu soumission par soumission
+SplitPredicate = Callable[[Exception], bool]
+
+
+class _Batch:
+    """Lot en attente d'envoi pour une clé donnée."""
+
+    def __init__(self, send: SendFunc) -> None:
+        self.send = send
+        self.entries: List[Tuple[List[Any], asyncio.Future]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class BatchDispatcher:
+    """
+    Fusionne les soumissions concurrentes vers une même clé en un seul appel.
+
+    Le premier appelant d'une clé ouvre une fenêtre de `max_wait_ms` millisecondes ;
+    le lot est envoyé à la fin de la fenêtre ou dès que `max_batch` éléments
+    sont accumulés. Un lot fusionné ne dépasse jamais `max_batch` éléments :
+    une soumission qui le ferait déborder part dans un nouveau lot, et une
+    soumission plus grande que `max_batch` est envoyée seule. Si l'appel fusionné est rejeté et que `split_on` l'autorise,
+    chaque soumission est rejouée individuellement afin qu'une entrée invalide
+    n'entraîne pas l'échec des autres. Les autres erreurs (délai dépassé,
+    erreur réseau ou serveur) sont transmises telles quelles à chaque appelant :
+    le serveur a pu appliquer le lot, et un rejeu dupliquerait les mutations.
+    """
+
+    def __init__(self, max_wait_ms: float = 5.0, max_batch: int = 32,
+                 split_on: Optional[SplitPredicate] = None) -> None:
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+        self.split_on = split_on
+        self._pending: Dict[Hashable, _Batch] = {}
+        # Références fortes vers les envois en cours : la boucle d'événements
+        # ne garde que des références faibles vers les tâches
+        self._tasks: Set[asyncio.Future] = set()
+
+    async def submit(self, key: Hashable, items: List[Any], send: SendFunc) -> Optional[List[Any]]:
+        """
+        Soumet des éléments pour envoi groupé.
+
+        Args:
+            key: Clé de regroupement (méthode, endpoint, identifiants...)
+            items: Éléments à fusionner dans le corps de la requête
+            send: Coroutine effectuant l'appel pour une liste fusionnée
+
+        Returns:
+            La portion du résultat correspondant aux éléments soumis,
+            ou None si l'API ne retourne pas de liste.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is not None and batch.size + len(items) > self.max_batch:
+            batch.timer.cancel()
+            self._flush(key, batch)
+            batch = None
+        if batch is None:
+            batch = _Batch(send)
+            self._pending[key] = batch
+            batch.timer = loop.call_later(self.max_wait, self._flush, key, batch)
+
+        future = loop.create_future()
+        batch.entries.append((items, future))
+        batch.size += len(items)
+
+        if batch.size >= self.max_batch:
+            batch.timer.cancel()
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: Hashable, batch: _Batch) -> None:
+        """Retire le lot de la file d'attente et planifie son envoi."""
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        """Envoie un lot fusionné et redistribue le résultat."""
+        merged = [item for items, _ in batch.entries for item in items]
+        logger.debug("Sending batch of %d items from %d submissions", len(merged), len(batch.entries))
+
+        try:
+            result = await batch.send(merged)
+        except Exception as e:
+            if len(batch.entries) == 1 or self.split_on is None or not self.split_on(e):
+                for _, future in batch.entries:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            logger.warning("Batched request failed (%s), retrying submissions individually", e)
+            await asyncio.gather(*(self._run_single(batch.send, items, future)
+                                   for items, future in batch.entries))
+            return
+
+        offset = 0
+        for items, future in batch.entries:
+            part = result[offset:offset + len(items)] if isinstance(result, list) else None
+            offset += len(items)
+            if not future.done():
+                future.set_result(part)
+
+    @staticmethod
+    async def _run_single(send: SendFunc, items: List[Any], future: asyncio.Future) -> None:
+        """Rejoue une soumission seule après l'échec d'un lot."""
+        try:
+            result = await send(items)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+
+class SingleFlight:
+    """
+    Déduplique les appels identiques en cours d'exécution.
+
+    Tant qu'un appel pour une clé n'est pas terminé, les appelants suivants
+    attendent son résultat au lieu d'émettre une nouvelle requête.
+    L'entrée est retirée dès la fin de l'appel, qu'il réussisse ou échoue.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Exécute `func` une seule fois pour tous les appelants concurrents de `key`.
+
+        Args:
+            key: Clé identifiant l'appel
+            func: Fabrique de la coroutine à exécuter
+
+        Returns:
+            Le résultat de l'appel partagé
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            logger.debug("Joining in-flight request for %s", key)
+        # shield : l'annulation d'un appelant n'interrompt pas l'appel partagé
+        return await asyncio.shield(task)
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Détache les appels en cours dont la clé satisfait le prédicat.
+
+        Leurs appelants actuels reçoivent toujours le résultat, mais les
+        appelants suivants déclenchent un nouvel appel au lieu de s'y joindre.
+        """
+        for key in [k for k in self._inflight if predicate(k)]:
+            del self._inflight[key]
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        """Retire l'appel terminé de la table des appels en cours."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
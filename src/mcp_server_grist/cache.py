@@ -0,0 +1,74 @@
+"""
+Cache en mémoire pour les réponses de l'API Grist.
+
+Ce module fournit un cache LRU à durée de vie limitée (TTL) utilisé pour
+mémoriser les métadonnées quasi immuables au cours d'une session
+(schémas de tables, détails de documents), avec conservation de l'ETag
+pour permettre une revalidation conditionnelle.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """Entrée du cache : date d'expiration, ETag éventuel et valeur."""
+    expires_at: float
+    etag: Optional[str]
+    value: Any
+
+
+class TTLCache:
+    """
+    Cache LRU dont les entrées expirent après `ttl` secondes.
+
+    Les entrées expirées ne sont pas supprimées immédiatement : leur ETag
+    reste disponible pour une revalidation via `If-None-Match`.
+    """
+
+    def __init__(self, maxsize: int = 500, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur si elle est présente et non expirée, sinon None."""
+        entry = self._data.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._data.move_to_end(key)
+        return entry.value
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Retourne l'entrée brute, même expirée (pour revalidation)."""
+        return self._data.get(key)
+
+    def set(self, key: Hashable, value: Any, etag: Optional[str] = None,
+            ttl: Optional[float] = None) -> None:
+        """Enregistre une valeur, en évinçant l'entrée la moins récemment utilisée si besoin."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = CacheEntry(expires_at, etag, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def touch(self, key: Hashable, ttl: Optional[float] = None) -> Optional[Any]:
+        """Prolonge la durée de vie d'une entrée revalidée et retourne sa valeur."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        self.set(key, entry.value, entry.etag, ttl)
+        return entry.value
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Supprime les entrées dont la clé satisfait le prédicat."""
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        self._data.clear()
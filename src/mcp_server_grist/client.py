@@ -6,20 +6,115 @@ facilitant les opérations CRUD sur les organisations, espaces de travail,
 documents, tables, colonnes et enregistrements.
 """
 
+import asyncio
+import difflib
+import importlib.util
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import httpx
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 
+try:
+    import aiohttp
+except ImportError:  # Backend optionnel
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # Sérialisation accélérée optionnelle
+    orjson = None
+
+from .batching import BatchDispatcher, SingleFlight
+from .cache import TTLCache
 from .models import GristColumn, GristDocument, GristOrg, GristRecord, GristTable, GristWorkspace
 from .version import __version__
 
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
 
+
+class GristHTTPError(ValueError):
+    """Réponse d'erreur HTTP (statut >= 400) de l'API Grist."""
+    
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"HTTP error: {status_code} - {text}")
+        self.status_code = status_code
+
+
+class PartialInsertError(ValueError):
+    """Insertion découpée interrompue : `record_ids` liste les IDs déjà créés."""
+    
+    def __init__(self, record_ids: List[int], error: Exception):
+        super().__init__(
+            f"Insert interrupted after {len(record_ids)} records (inserted IDs: {record_ids}): {error}"
+        )
+        self.record_ids = record_ids
+
+
+def _is_rejected(error: Exception) -> bool:
+    """Indique si l'API a refusé la requête (4xx), donc sans l'avoir appliquée."""
+    return isinstance(error, GristHTTPError) and 400 <= error.status_code < 500
+
+
+# Regroupe les mutations concurrentes (enregistrements, colonnes, tables) en un
+# seul appel HTTP d'au plus 32 éléments (bien en deçà de _RECORDS_CHUNK_SIZE) ;
+# seul un lot refusé (4xx) est rejoué soumission par soumission
+_mutation_dispatcher = BatchDispatcher(max_wait_ms=5.0, max_batch=32, split_on=_is_rejected)
+
+# Clients partagés pour toute la durée du processus,
+# par (clé API, URL, backend, HTTP/2, taille du pool)
+_clients: Dict[Tuple[str, str, str, bool, Optional[int]], "GristClient"] = {}
+
+# Le fichier .env n'est lu qu'une fois : load_dotenv remonte l'arborescence
+# à chaque appel et n'écrase pas les variables déjà définies
+_dotenv_loaded = False
+
+# Durée de vie (s) des listes de tables et de colonnes mémorisées ; toute
+# mutation du document via ce client les invalide immédiatement
+_STRUCTURE_TTL = 15.0
+
+# Découpage des insertions volumineuses d'enregistrements
+_RECORDS_CHUNK_SIZE = 500
+
+# Validation des listes de modèles en un seul appel à pydantic-core
+_ORGS_ADAPTER = TypeAdapter(List[GristOrg])
+_WORKSPACES_ADAPTER = TypeAdapter(List[GristWorkspace])
+_DOCUMENTS_ADAPTER = TypeAdapter(List[GristDocument])
+_TABLES_ADAPTER = TypeAdapter(List[GristTable])
+_COLUMNS_ADAPTER = TypeAdapter(List[GristColumn])
+_RECORDS_ADAPTER = TypeAdapter(List[GristRecord])
+
+# Références de colonnes dans une formule Grist ($colonne)
+_COLUMN_REF_RE = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)')
+
+# Le support HTTP/2 de httpx nécessite le paquet optionnel h2 (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Erreurs réseau remontées comme "Request error"
+_REQUEST_ERRORS: Tuple[type, ...] = (httpx.RequestError,)
+if aiohttp is not None:
+    _REQUEST_ERRORS += (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Sérialise un corps de requête en JSON (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    """Désérialise un corps de réponse JSON (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def mask_api_key(api_key: str) -> str:
     """Masquer la clé API pour les logs."""
     if len(api_key) > 10:
@@ -29,70 +124,285 @@ def mask_api_key(api_key: str) -> str:
 class GristClient:
     """Client pour l'API Grist."""
     
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(self, api_key: str, api_url: str, backend: str = "httpx", http2: bool = False,
+                 max_connections: Optional[int] = None):
         self.api_key = api_key
         self.api_url = api_url
+        # URL de base normalisée une fois pour toutes (sans / final)
+        self._base_url = api_url.rstrip('/')
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
-        logger.debug(f"GristClient initialized with API URL: {api_url}")
-        logger.debug(f"API key: {mask_api_key(api_key)}")
+        # En-têtes des envois multipart : httpx génère lui-même le Content-Type
+        self._upload_headers = {k: v for k, v in self.headers.items() if k != "Content-Type"}
+        if backend == "aiohttp" and aiohttp is None:
+            logger.warning("aiohttp n'est pas installé, utilisation du backend httpx")
+            backend = "httpx"
+        self.backend = backend
+        if http2 and not _HTTP2_AVAILABLE:
+            logger.warning("h2 n'est pas installé, HTTP/2 désactivé (pip install httpx[http2])")
+            http2 = False
+        self.http2 = http2
+        # Taille du pool de connexions (None : valeur par défaut du backend)
+        self.max_connections = max_connections
+        self._http: Optional[httpx.AsyncClient] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Métadonnées mémorisées (schémas, détails de documents), clés (type, doc_id, ...)
+        self._cache = TTLCache(maxsize=500, ttl=60.0)
+        # Résultats des requêtes SQL, clés (doc_id, requête normalisée, paramètres)
+        self._sql_cache = TTLCache(maxsize=256, ttl=30.0)
+        # Lectures identiques en cours, partagées entre appelants concurrents ;
+        # clés (type, doc_id, ...) afin de pouvoir les détacher par document
+        self._inflight = SingleFlight()
+        # Génération des données de chaque document, incrémentée à chaque mutation :
+        # une lecture lancée avant une mutation n'alimente pas le cache
+        self._generations: Dict[str, int] = {}
+        logger.debug("GristClient initialized with API URL: %s (backend: %s)", api_url, backend)
+        logger.debug("API key: %s", mask_api_key(api_key))
     
-    async def _request(self, 
-                      method: str, 
-                      endpoint: str, 
-                      json_data: Optional[Dict[str, Any]] = None,
-                      params: Optional[Dict[str, Any]] = None) -> Any:
-        """Effectue une requête à l'API Grist."""
-        # Fix URL construction: ensure endpoint starts with / and base URL doesn't end with /
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Retourne le client HTTP persistant, en le créant au premier appel.
+        
+        Le client est réutilisé par toutes les requêtes afin de conserver
+        les connexions (keep-alive) et d'éviter une poignée de main TLS par appel.
+        """
+        if self._http is None or self._http.is_closed:
+            max_connections = self.max_connections or 64
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(1, max_connections // 2),
+                    max_connections=max_connections
+                ),
+                http2=self.http2
+            )
+        return self._http
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Retourne la session aiohttp persistante, en la créant au premier appel."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections or 100, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Ferme les connexions HTTP persistantes."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _send(self,
+                    method: str,
+                    url: str,
+                    json_data: Optional[Any] = None,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, bytes]:
+        """
+        Envoie une requête avec le backend configuré et retourne (statut, en-têtes, corps).
+        
+        Les téléchargements et envois de fichiers (_download, upload_attachments)
+        passent toujours par le client httpx.
+        """
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        content = _json_dumps(json_data) if json_data is not None else None
+        if self.backend == "aiohttp":
+            async with self._get_session().request(
+                method,
+                url,
+                headers=request_headers,
+                data=content,
+                params=params
+            ) as response:
+                return response.status, response.headers, await response.read()
+        
+        response = await self._get_http().request(
+            method=method,
+            url=url,
+            headers=request_headers,
+            content=content,
+            params=params
+        )
+        return response.status_code, response.headers, response.content
+    
+    async def _fetch(self,
+                     method: str,
+                     endpoint: str,
+                     json_data: Optional[Dict[str, Any]] = None,
+                     params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, bytes]:
+        """Effectue une requête brute à l'API Grist et retourne (statut, en-têtes, corps)."""
+        # Fix URL construction: ensure endpoint starts with /
         if not endpoint.startswith('/'):
             endpoint = '/' + endpoint
-        api_url = self.api_url.rstrip('/')
-        url = api_url + endpoint
+        url = self._base_url + endpoint
         
-        logger.debug(f"Making {method} request to {url}")
+        logger.debug("Making %s request to %s", method, url)
         if params:
-            logger.debug(f"Params: {params}")
-        if json_data:
-            logger.debug(f"JSON data: {json.dumps(json_data)[:200]}...")
+            logger.debug("Params: %s", params)
+        if json_data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JSON data: %s...", json.dumps(json_data)[:200])
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:  # Set a reasonable timeout
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=json_data,
-                    params=params
-                )
-                
-                logger.debug(f"Response status: {response.status_code}")
-                
-                if response.status_code >= 400:
-                    logger.error(f"Error response: {response.text}")
-                    logger.error(f"URL that failed: {url}")
-                
-                response.raise_for_status()
-                
-                # Log first part of response for debugging
-                json_response = response.json()
-                logger.debug(f"Response preview: {str(json_response)[:200]}...")
-                return json_response
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
-            logger.error(f"Failed URL: {url}")
-            logger.error(f"Response text: {e.response.text}")
-            raise ValueError(f"HTTP error: {e.response.status_code} - {e.response.text}")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            logger.error(f"Failed URL: {url}")
+            status, response_headers, body = await self._send(
+                method, url, json_data=json_data, params=params, headers=headers
+            )
+        except _REQUEST_ERRORS as e:
+            logger.error("Request error: %s", e)
+            logger.error("Failed URL: %s", url)
             raise ValueError(f"Request error: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            logger.error(f"Failed URL: {url}")
+            logger.error("Unexpected error: %s", e)
+            logger.error("Failed URL: %s", url)
+            raise ValueError(f"Unexpected error: {str(e)}")
+        finally:
+            if method != "GET":
+                self._invalidate_doc_cache(endpoint)
+        
+        logger.debug("Response status: %s", status)
+        
+        if status >= 400:
+            text = body.decode("utf-8", errors="replace")
+            logger.error("HTTP error: %s", status)
+            logger.error("Failed URL: %s", url)
+            logger.error("Response text: %s", text)
+            raise GristHTTPError(status, text)
+        
+        return status, response_headers, body
+    
+    @staticmethod
+    def _parse_json(body: bytes) -> Any:
+        """Décode un corps de réponse JSON (None si vide)."""
+        try:
+            json_response = _json_loads(body) if body else None
+        except ValueError as e:
+            logger.error("Unexpected error: %s", e)
             raise ValueError(f"Unexpected error: {str(e)}")
+        
+        # Log first part of response for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response preview: %s...", str(json_response)[:200])
+        return json_response
+    
+    async def _request(self, 
+                      method: str, 
+                      endpoint: str, 
+                      json_data: Optional[Dict[str, Any]] = None,
+                      params: Optional[Dict[str, Any]] = None) -> Any:
+        """Effectue une requête à l'API Grist."""
+        _, _, body = await self._fetch(method, endpoint, json_data=json_data, params=params)
+        return self._parse_json(body)
+    
+    async def _cached_get(self, cache_key: Tuple[Any, ...], endpoint: str,
+                          params: Optional[Dict[str, Any]] = None,
+                          ttl: Optional[float] = None,
+                          refresh: bool = False) -> Any:
+        """
+        Effectue un GET mémorisé dans le cache de métadonnées.
+        
+        Une entrée encore valide est retournée sans appel réseau, sauf si
+        `refresh` est demandé. Une entrée expirée (ou à rafraîchir) disposant
+        d'un ETag est revalidée via `If-None-Match` : un 304 prolonge sa durée
+        de vie sans retransférer le corps.
+        """
+        cached = None if refresh else self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for %s", endpoint)
+            return cached
+        
+        return await self._inflight.do(cache_key, lambda: self._revalidate(cache_key, endpoint, params, ttl))
+    
+    async def _revalidate(self, cache_key: Tuple[Any, ...], endpoint: str,
+                          params: Optional[Dict[str, Any]] = None,
+                          ttl: Optional[float] = None) -> Any:
+        """Récupère ou revalide (If-None-Match) une entrée du cache de métadonnées."""
+        doc_id = cache_key[1]
+        generation = self._generations.get(doc_id, 0)
+        entry = self._cache.get_entry(cache_key)
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        
+        status, response_headers, body = await self._fetch("GET", endpoint, params=params, headers=headers)
+        # Un document modifié pendant la lecture ne doit pas être mémorisé
+        fresh = self._generations.get(doc_id, 0) == generation
+        if status == 304 and entry is not None:
+            logger.debug("Cache revalidated for %s", endpoint)
+            if fresh:
+                self._cache.touch(cache_key, ttl=ttl)
+            return entry.value
+        
+        result = self._parse_json(body)
+        if fresh:
+            self._cache.set(cache_key, result, etag=response_headers.get("ETag"), ttl=ttl)
+        return result
+    
+    def _invalidate_doc_cache(self, endpoint: str) -> None:
+        """
+        Invalide les données mémorisées d'un document après une mutation.
+        
+        Les lectures en cours sur ce document sont détachées : leur résultat,
+        antérieur à la mutation, n'est ni partagé avec les appelants suivants
+        ni enregistré dans le cache.
+        """
+        if not endpoint.startswith("/docs/") or endpoint.endswith("/sql"):
+            return
+        doc_id = endpoint.split("/", 3)[2]
+        self._generations[doc_id] = self._generations.get(doc_id, 0) + 1
+        self._cache.invalidate(lambda key: key[1] == doc_id)
+        self._sql_cache.invalidate(lambda key: key[0] == doc_id)
+        self._inflight.forget(lambda key: key[1] == doc_id)
+    
+    async def _batched_request(self, method: str, endpoint: str,
+                               payload: Dict[str, Any], list_key: str,
+                               shape: Optional[Hashable] = None) -> Optional[List[Any]]:
+        """
+        Envoie une mutation via le répartiteur de lots.
+
+        Les appels concurrents vers le même endpoint (et de même `shape`) sont
+        fusionnés en une seule requête dont le corps contient la concaténation
+        des listes `list_key`.
+        """
+        items = payload.get(list_key)
+        if set(payload) != {list_key} or not isinstance(items, list) or not items:
+            result = await self._request(method, endpoint, json_data=payload)
+            return result.get(list_key) if isinstance(result, dict) else None
+        
+        async def send(merged: List[Any]) -> Optional[List[Any]]:
+            result = await self._request(method, endpoint, json_data={list_key: merged})
+            return result.get(list_key) if isinstance(result, dict) else None
+        
+        key = (self.api_url, self.api_key, method, endpoint, shape)
+        return await _mutation_dispatcher.submit(key, items, send)
+    
+    async def _download_response(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                                 timeout: float = 60.0) -> httpx.Response:
+        """Télécharge un fichier via le client HTTP persistant et retourne la réponse httpx."""
+        response = await self._get_http().get(
+            self._base_url + endpoint,
+            headers=self.headers,
+            params=params,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return response
+    
+    async def _download(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                        timeout: float = 60.0) -> bytes:
+        """
+        Télécharge un fichier via le client HTTP persistant.
+        
+        La connexion est reprise du pool ; le corps est retourné tel que lu
+        par httpx, sans copie intermédiaire.
+        """
+        response = await self._download_response(endpoint, params=params, timeout=timeout)
+        return response.content
     
     # --- Organisation Methods ---
     
@@ -103,138 +413,149 @@ class GristClient:
         
         # Check if the response is in the expected format
         if not isinstance(data, list):
-            logger.warning(f"Unexpected response format: {data}")
+            logger.warning("Unexpected response format: %s", data)
             return []
-        return [GristOrg(**org) for org in data]
+        return _ORGS_ADAPTER.validate_python(data)
     
     async def describe_org(self, org_id: Union[int, str]) -> Dict[str, Any]:
         """Obtient les détails d'une organisation spécifique."""
-        logger.debug(f"Describing organization {org_id}")
+        logger.debug("Describing organization %s", org_id)
         return await self._request("GET", f"/orgs/{org_id}")
     
     async def modify_org(self, org_id: Union[int, str], org_data: Dict[str, Any]) -> None:
         """Modifie une organisation."""
-        logger.debug(f"Modifying organization {org_id}")
+        logger.debug("Modifying organization %s", org_id)
         await self._request("PATCH", f"/orgs/{org_id}", json_data=org_data)
     
     async def delete_org(self, org_id: Union[int, str]) -> None:
         """Supprime une organisation."""
-        logger.debug(f"Deleting organization {org_id}")
+        logger.debug("Deleting organization %s", org_id)
         await self._request("DELETE", f"/orgs/{org_id}")
     
     # --- Workspace Methods ---
     
     async def list_workspaces(self, org_id: Union[int, str]) -> List[GristWorkspace]:
         """Liste tous les espaces de travail d'une organisation."""
-        logger.debug(f"Listing workspaces for org {org_id}")
+        logger.debug("Listing workspaces for org %s", org_id)
         data = await self._request("GET", f"/orgs/{org_id}/workspaces")
         
         # Check if the response is in the expected format
         if not isinstance(data, list):
-            logger.warning(f"Unexpected response format for workspaces: {data}")
+            logger.warning("Unexpected response format for workspaces: %s", data)
             return []
             
-        return [GristWorkspace(**workspace) for workspace in data]
+        return _WORKSPACES_ADAPTER.validate_python(data)
     
     async def describe_workspace(self, workspace_id: int) -> Dict[str, Any]:
         """Obtient les détails d'un espace de travail spécifique."""
-        logger.debug(f"Describing workspace {workspace_id}")
+        logger.debug("Describing workspace %s", workspace_id)
         return await self._request("GET", f"/workspaces/{workspace_id}")
     
     async def create_workspace(self, org_id: Union[int, str], workspace_data: Dict[str, Any]) -> int:
         """Crée un nouvel espace de travail dans une organisation."""
-        logger.debug(f"Creating workspace in organization {org_id}")
+        logger.debug("Creating workspace in organization %s", org_id)
         result = await self._request("POST", f"/orgs/{org_id}/workspaces", json_data=workspace_data)
         return result
     
     async def modify_workspace(self, workspace_id: int, workspace_data: Dict[str, Any]) -> None:
         """Modifie un espace de travail."""
-        logger.debug(f"Modifying workspace {workspace_id}")
+        logger.debug("Modifying workspace %s", workspace_id)
         await self._request("PATCH", f"/workspaces/{workspace_id}", json_data=workspace_data)
     
     async def delete_workspace(self, workspace_id: int) -> None:
         """Supprime un espace de travail."""
-        logger.debug(f"Deleting workspace {workspace_id}")
+        logger.debug("Deleting workspace %s", workspace_id)
         await self._request("DELETE", f"/workspaces/{workspace_id}")
     
     # --- Document Methods ---
     
     async def list_documents(self, workspace_id: int) -> List[GristDocument]:
         """Liste tous les documents d'un espace de travail."""
-        logger.debug(f"Listing documents for workspace {workspace_id}")
+        logger.debug("Listing documents for workspace %s", workspace_id)
         data = await self._request("GET", f"/workspaces/{workspace_id}")
 
         # Check if the expected 'docs' key exists
         if "docs" not in data:
-            logger.warning(f"No 'docs' key found in workspace data: {data}")
+            logger.warning("No 'docs' key found in workspace data: %s", data)
             return []
             
         docs = data.get("docs", [])
-        return [GristDocument(**doc) for doc in docs]
+        return _DOCUMENTS_ADAPTER.validate_python(docs)
     
     async def describe_doc(self, doc_id: str) -> Dict[str, Any]:
         """Obtient les détails d'un document spécifique."""
-        logger.debug(f"Describing document {doc_id}")
-        return await self._request("GET", f"/docs/{doc_id}")
+        logger.debug("Describing document %s", doc_id)
+        return await self._cached_get(("doc", doc_id), f"/docs/{doc_id}")
     
     async def create_doc(self, workspace_id: int, doc_data: Dict[str, Any]) -> str:
         """Crée un nouveau document dans un espace de travail."""
-        logger.debug(f"Creating document in workspace {workspace_id}")
+        logger.debug("Creating document in workspace %s", workspace_id)
         result = await self._request("POST", f"/workspaces/{workspace_id}/docs", json_data=doc_data)
         return result
     
     async def modify_doc(self, doc_id: str, doc_data: Dict[str, Any]) -> None:
         """Modifie un document."""
-        logger.debug(f"Modifying document {doc_id}")
+        logger.debug("Modifying document %s", doc_id)
         await self._request("PATCH", f"/docs/{doc_id}", json_data=doc_data)
     
     async def delete_doc(self, doc_id: str) -> None:
         """Supprime un document."""
-        logger.debug(f"Deleting document {doc_id}")
+        logger.debug("Deleting document %s", doc_id)
         await self._request("DELETE", f"/docs/{doc_id}")
     
     async def move_doc(self, doc_id: str, target_workspace_id: int) -> None:
         """Déplace un document vers un autre espace de travail."""
-        logger.debug(f"Moving document {doc_id} to workspace {target_workspace_id}")
+        logger.debug("Moving document %s to workspace %s", doc_id, target_workspace_id)
         await self._request("PATCH", f"/docs/{doc_id}/move", json_data={"workspace": target_workspace_id})
 
     # --- Table Methods ---
     
-    async def list_tables(self, doc_id: str) -> List[GristTable]:
-        """Liste toutes les tables d'un document."""
-        logger.debug(f"Listing tables for document {doc_id}")
-        data = await self._request("GET", f"/docs/{doc_id}/tables")
-        return [GristTable(**table) for table in data.get("tables", [])]
+    async def list_tables(self, doc_id: str, refresh: bool = False) -> List[GristTable]:
+        """Liste toutes les tables d'un document (refresh : ignorer la liste mémorisée)."""
+        logger.debug("Listing tables for document %s", doc_id)
+        data = await self._cached_get(
+            ("tables", doc_id), f"/docs/{doc_id}/tables", ttl=_STRUCTURE_TTL, refresh=refresh
+        )
+        return _TABLES_ADAPTER.validate_python(data.get("tables", []))
     
     async def create_tables(self, doc_id: str, tables_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Crée de nouvelles tables dans un document."""
-        logger.debug(f"Creating tables in document {doc_id}")
+        logger.debug("Creating tables in document %s", doc_id)
         result = await self._request("POST", f"/docs/{doc_id}/tables", json_data=tables_data)
         return result.get("tables", [])
     
     async def modify_tables(self, doc_id: str, tables_data: Dict[str, Any]) -> None:
         """Modifie des tables dans un document."""
-        logger.debug(f"Modifying tables in document {doc_id}")
-        await self._request("PATCH", f"/docs/{doc_id}/tables", json_data=tables_data)
+        logger.debug("Modifying tables in document %s", doc_id)
+        await self._batched_request("PATCH", f"/docs/{doc_id}/tables", tables_data, "tables")
 
     # --- Column Methods ---
     
-    async def list_columns(self, doc_id: str, table_id: str) -> List[GristColumn]:
-        """Liste toutes les colonnes d'une table."""
-        logger.debug(f"Listing columns for table {table_id} in document {doc_id}")
-        data = await self._request("GET", f"/docs/{doc_id}/tables/{table_id}/columns")
-        return [GristColumn(**column) for column in data.get("columns", [])]
+    async def list_columns(self, doc_id: str, table_id: str, refresh: bool = False) -> List[GristColumn]:
+        """Liste toutes les colonnes d'une table (refresh : ignorer la liste mémorisée)."""
+        logger.debug("Listing columns for table %s in document %s", table_id, doc_id)
+        data = await self._cached_get(
+            ("columns", doc_id, table_id),
+            f"/docs/{doc_id}/tables/{table_id}/columns",
+            ttl=_STRUCTURE_TTL,
+            refresh=refresh
+        )
+        return _COLUMNS_ADAPTER.validate_python(data.get("columns", []))
     
     async def create_columns(self, doc_id: str, table_id: str, columns_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Crée de nouvelles colonnes dans une table."""
-        logger.debug(f"Creating columns in table {table_id} of document {doc_id}")
-        result = await self._request("POST", f"/docs/{doc_id}/tables/{table_id}/columns", json_data=columns_data)
-        return result.get("columns", [])
+        logger.debug("Creating columns in table %s of document %s", table_id, doc_id)
+        result = await self._batched_request(
+            "POST", f"/docs/{doc_id}/tables/{table_id}/columns", columns_data, "columns"
+        )
+        return result or []
     
     async def modify_columns(self, doc_id: str, table_id: str, columns_data: Dict[str, Any]) -> None:
         """Modifie des colonnes dans une table."""
-        logger.debug(f"Modifying columns in table {table_id} of document {doc_id}")
-        await self._request("PATCH", f"/docs/{doc_id}/tables/{table_id}/columns", json_data=columns_data)
+        logger.debug("Modifying columns in table %s of document %s", table_id, doc_id)
+        await self._batched_request(
+            "PATCH", f"/docs/{doc_id}/tables/{table_id}/columns", columns_data, "columns"
+        )
     
     async def replace_columns(self, doc_id: str, table_id: str, columns_data: Dict[str, Any], 
                             noadd: bool = False, noupdate: bool = False, replaceall: bool = False) -> None:
@@ -247,13 +568,13 @@ class GristClient:
         if replaceall:
             params["replaceall"] = "true"
         
-        logger.debug(f"Replacing columns in table {table_id} of document {doc_id}")
+        logger.debug("Replacing columns in table %s of document %s", table_id, doc_id)
         await self._request("PUT", f"/docs/{doc_id}/tables/{table_id}/columns", 
                           json_data=columns_data, params=params)
     
     async def delete_column(self, doc_id: str, table_id: str, col_id: str) -> None:
         """Supprime une colonne d'une table."""
-        logger.debug(f"Deleting column {col_id} from table {table_id} in document {doc_id}")
+        logger.debug("Deleting column %s from table %s in document %s", col_id, table_id, doc_id)
         await self._request("DELETE", f"/docs/{doc_id}/tables/{table_id}/columns/{col_id}")
 
     # --- Record Methods ---
@@ -268,35 +589,62 @@ class GristClient:
         if limit and limit > 0:
             params["limit"] = limit
         
-        logger.debug(f"Listing records for table {table_id} in document {doc_id} with params: {params}")    
+        logger.debug("Listing records for table %s in document %s with params: %s", table_id, doc_id, params)    
         data = await self._request(
             "GET", 
             f"/docs/{doc_id}/tables/{table_id}/records",
             params=params
         )
-        return [GristRecord(**record) for record in data.get("records", [])]
+        return _RECORDS_ADAPTER.validate_python(data.get("records", []))
     
     async def add_records(self, doc_id: str, table_id: str, 
                         records: List[Dict[str, Any]]) -> List[int]:
-        """Ajoute des enregistrements à une table."""
+        """
+        Ajoute des enregistrements à une table.
+        
+        Au-delà de _RECORDS_CHUNK_SIZE enregistrements, l'insertion est découpée
+        en requêtes envoyées l'une après l'autre, afin que les lignes soient créées
+        dans l'ordre fourni. Si un bloc échoue, PartialInsertError indique les IDs
+        des blocs déjà insérés.
+        En deçà, les insertions concurrentes dans une même table passent par
+        le répartiteur de lots et sont fusionnées en une seule requête.
+        """
         # Verify input data format
         if all("fields" in record for record in records):
             # Data is already in the expected API format
-            formatted_records = {"records": records}
+            formatted_records = records
             logger.debug("Records already in expected format")
         else:
             # Transform data to expected API format
-            formatted_records = {"records": [{"fields": record} for record in records]}
+            formatted_records = [{"fields": record} for record in records]
             logger.debug("Transforming records to expected format")
         
-        logger.debug(f"Adding records to table {table_id} in document {doc_id}")
+        logger.debug("Adding records to table %s in document %s", table_id, doc_id)
+        endpoint = f"/docs/{doc_id}/tables/{table_id}/records"
         
-        data = await self._request(
-            "POST",
-            f"/docs/{doc_id}/tables/{table_id}/records",
-            json_data=formatted_records
-        )
-        return [record["id"] for record in data.get("records", [])]
+        if len(formatted_records) <= _RECORDS_CHUNK_SIZE:
+            # Seules les insertions portant sur les mêmes colonnes sont fusionnées :
+            # Grist remplirait sinon les colonnes absentes par null au lieu de
+            # leur valeur par défaut
+            shape = frozenset().union(*(record["fields"] for record in formatted_records))
+            created = await self._batched_request(
+                "POST", endpoint, {"records": formatted_records}, "records", shape=shape
+            )
+            return [record["id"] for record in created or []]
+        
+        logger.debug("Adding %s records in chunks of %s", len(formatted_records), _RECORDS_CHUNK_SIZE)
+        record_ids: List[int] = []
+        for start in range(0, len(formatted_records), _RECORDS_CHUNK_SIZE):
+            chunk = formatted_records[start:start + _RECORDS_CHUNK_SIZE]
+            try:
+                data = await self._request("POST", endpoint, json_data={"records": chunk})
+            except Exception as e:
+                if not record_ids:
+                    raise
+                logger.warning("Chunked insert into %s interrupted, inserted IDs: %s", table_id, record_ids)
+                raise PartialInsertError(record_ids, e) from e
+            record_ids.extend(record["id"] for record in data.get("records", []))
+        return record_ids
     
     async def update_records(self, doc_id: str, table_id: str, 
                           records: List[Dict[str, Any]]) -> List[int]:
@@ -321,7 +669,7 @@ class GristClient:
                 formatted_records["records"].append(formatted_record)
             logger.debug("Transforming records to expected format")
         
-        logger.debug(f"Updating records in table {table_id} in document {doc_id}")
+        logger.debug("Updating records in table %s in document %s", table_id, doc_id)
         
         data = await self._request(
             "PATCH",
@@ -339,12 +687,12 @@ class GristClient:
             return [record["id"] for record in data["records"]]
         else:
             # If structure is not recognized, log and return provided IDs
-            logger.warning(f"Unexpected response format: {data}")
+            logger.warning("Unexpected response format: %s", data)
             return [record["id"] for record in formatted_records["records"]]
     
     async def delete_records(self, doc_id: str, table_id: str, record_ids: List[int]) -> None:
         """Supprime des enregistrements d'une table."""
-        logger.debug(f"Deleting records with IDs {record_ids} from table {table_id} in document {doc_id}")
+        logger.debug("Deleting records with IDs %s from table %s in document %s", record_ids, table_id, doc_id)
         
         # L'API Grist attend un tableau d'IDs directement
         await self._request(
@@ -352,38 +700,38 @@ class GristClient:
             f"/docs/{doc_id}/tables/{table_id}/data/delete",
             json_data=record_ids  # Envoi direct de la liste d'IDs
         )
-        logger.debug(f"Successfully deleted {len(record_ids)} records")
+        logger.debug("Successfully deleted %s records", len(record_ids))
 
     # --- Access Management Methods ---
     
     async def list_org_access(self, org_id: Union[int, str]) -> Dict[str, Any]:
         """Liste les utilisateurs ayant accès à une organisation."""
-        logger.debug(f"Listing access for organization {org_id}")
+        logger.debug("Listing access for organization %s", org_id)
         return await self._request("GET", f"/orgs/{org_id}/access")
     
     async def modify_org_access(self, org_id: Union[int, str], access_delta: Dict[str, Any]) -> None:
         """Modifie l'accès à une organisation."""
-        logger.debug(f"Modifying access for organization {org_id}")
+        logger.debug("Modifying access for organization %s", org_id)
         await self._request("PATCH", f"/orgs/{org_id}/access", json_data={"delta": access_delta})
     
     async def list_workspace_access(self, workspace_id: int) -> Dict[str, Any]:
         """Liste les utilisateurs ayant accès à un espace de travail."""
-        logger.debug(f"Listing access for workspace {workspace_id}")
+        logger.debug("Listing access for workspace %s", workspace_id)
         return await self._request("GET", f"/workspaces/{workspace_id}/access")
     
     async def modify_workspace_access(self, workspace_id: int, access_delta: Dict[str, Any]) -> None:
         """Modifie l'accès à un espace de travail."""
-        logger.debug(f"Modifying access for workspace {workspace_id}")
+        logger.debug("Modifying access for workspace %s", workspace_id)
         await self._request("PATCH", f"/workspaces/{workspace_id}/access", json_data={"delta": access_delta})
     
     async def list_doc_access(self, doc_id: str) -> Dict[str, Any]:
         """Liste les utilisateurs ayant accès à un document."""
-        logger.debug(f"Listing access for document {doc_id}")
+        logger.debug("Listing access for document %s", doc_id)
         return await self._request("GET", f"/docs/{doc_id}/access")
     
     async def modify_doc_access(self, doc_id: str, access_delta: Dict[str, Any]) -> None:
         """Modifie l'accès à un document."""
-        logger.debug(f"Modifying access for document {doc_id}")
+        logger.debug("Modifying access for document %s", doc_id)
         await self._request("PATCH", f"/docs/{doc_id}/access", json_data={"delta": access_delta})
 
     # --- Download and Export Methods ---
@@ -396,82 +744,104 @@ class GristClient:
         if template:
             params["template"] = "true"
         
-        logger.debug(f"Downloading document {doc_id} as SQLite")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method="GET",
-                url=f"{self.api_url.rstrip('/')}/docs/{doc_id}/download",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.content
+        logger.debug("Downloading document %s as SQLite", doc_id)
+        return await self._download(f"/docs/{doc_id}/download", params=params, timeout=60.0)
     
     async def download_doc_xlsx(self, doc_id: str, header: str = "label") -> bytes:
         """Télécharge un document au format Excel."""
         params = {"header": header}
         
-        logger.debug(f"Downloading document {doc_id} as Excel")
+        logger.debug("Downloading document %s as Excel", doc_id)
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:  # Augmenter timeout
-                response = await client.request(
-                    method="GET",
-                    url=f"{self.api_url.rstrip('/')}/docs/{doc_id}/download/xlsx",
-                    headers=self.headers,
-                    params=params
-                )
-                
-                logger.debug(f"Excel download response status: {response.status_code}")
-                logger.debug(f"Excel download response headers: {dict(response.headers)}")
-                
-                response.raise_for_status()
-                return response.content
-                
+            # Augmenter timeout
+            return await self._download(f"/docs/{doc_id}/download/xlsx", params=params, timeout=120.0)
         except httpx.TimeoutException as e:
-            logger.error(f"Excel download timeout for doc {doc_id}: {e}")
+            logger.error("Excel download timeout for doc %s: %s", doc_id, e)
             raise ValueError(f"Excel download timeout - document may be too large. Try download_document_sqlite as alternative.")
         except httpx.HTTPStatusError as e:
-            logger.error(f"Excel download HTTP error for doc {doc_id}: {e}")
-            logger.error(f"Response text: {e.response.text}")
+            logger.error("Excel download HTTP error for doc %s: %s", doc_id, e)
+            logger.error("Response text: %s", e.response.text)
             raise ValueError(f"Excel download failed: {e.response.status_code} - {e.response.text}")
         except Exception as e:
-            logger.error(f"Excel download unexpected error for doc {doc_id}: {e}")
+            logger.error("Excel download unexpected error for doc %s: %s", doc_id, e)
             raise ValueError(f"Excel download failed: {str(e)}")
     
     async def download_doc_csv(self, doc_id: str, table_id: str, header: str = "label") -> str:
         """Télécharge une table au format CSV."""
         params = {"tableId": table_id, "header": header}
         
-        logger.debug(f"Downloading table {table_id} from document {doc_id} as CSV")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method="GET",
-                url=f"{self.api_url.rstrip('/')}/docs/{doc_id}/download/csv",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.text
+        logger.debug("Downloading table %s from document %s as CSV", table_id, doc_id)
+        response = await self._download_response(f"/docs/{doc_id}/download/csv", params=params, timeout=60.0)
+        # Jeu de caractères annoncé par le serveur, UTF-8 à défaut ; un octet
+        # invalide est remplacé plutôt que de faire échouer tout l'export
+        encoding = response.charset_encoding or "utf-8"
+        try:
+            return response.content.decode(encoding, errors="replace")
+        except LookupError:
+            return response.content.decode("utf-8", errors="replace")
     
     async def download_table_schema(self, doc_id: str, table_id: str, header: str = "label") -> Dict[str, Any]:
         """Télécharge le schéma d'une table."""
         params = {"tableId": table_id, "header": header}
         
-        logger.debug(f"Downloading schema for table {table_id} from document {doc_id}")
-        return await self._request("GET", f"/docs/{doc_id}/download/table-schema", params=params)
+        logger.debug("Downloading schema for table %s from document %s", table_id, doc_id)
+        return await self._cached_get(
+            ("schema", doc_id, table_id, header),
+            f"/docs/{doc_id}/download/table-schema",
+            params=params
+        )
 
     # --- Document Management Methods ---
     
     async def force_reload_doc(self, doc_id: str) -> None:
         """Force le rechargement d'un document."""
-        logger.debug(f"Force reloading document {doc_id}")
+        logger.debug("Force reloading document %s", doc_id)
         await self._request("POST", f"/docs/{doc_id}/force-reload")
     
     async def delete_doc_history(self, doc_id: str, keep: int) -> None:
         """Supprime l'historique d'un document, ne conservant que les dernières actions."""
-        logger.debug(f"Deleting history for document {doc_id}, keeping {keep} actions")
+        logger.debug("Deleting history for document %s, keeping %s actions", doc_id, keep)
         await self._request("POST", f"/docs/{doc_id}/states/remove", json_data={"keep": keep})
 
+    # --- SQL Methods ---
+    
+    @staticmethod
+    def _sql_cache_key(doc_id: str, sql: str, args: Optional[List[Any]]) -> Tuple[str, str, bytes]:
+        """Construit la clé de cache d'une requête SQL (espaces normalisés, casse conservée)."""
+        return doc_id, " ".join(sql.split()), _json_dumps(args or [])
+    
+    def cached_sql_result(self, doc_id: str, sql: str, args: Optional[List[Any]] = None) -> Optional[Dict[str, Any]]:
+        """Retourne le résultat mémorisé d'une requête SQL, ou None."""
+        return self._sql_cache.get(self._sql_cache_key(doc_id, sql, args))
+    
+    async def sql_query(self, doc_id: str, sql: str, args: Optional[List[Any]] = None,
+                        timeout_ms: Optional[int] = None,
+                        cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Exécute une requête SQL en lecture seule sur un document.
+        
+        Si `cache_ttl` est fourni, le résultat est mémorisé pendant cette durée
+        (en secondes). Toute mutation du document invalide ses résultats mémorisés.
+        """
+        query_data = {
+            "sql": sql,
+            "args": args or []
+        }
+        if timeout_ms:
+            query_data["timeout"] = timeout_ms
+        
+        cache_key = self._sql_cache_key(doc_id, sql, args)
+        generation = self._generations.get(doc_id, 0)
+        logger.debug("Running SQL query on document %s", doc_id)
+        result = await self._inflight.do(
+            ("sql",) + cache_key + (timeout_ms,),
+            lambda: self._request("POST", f"/docs/{doc_id}/sql", json_data=query_data)
+        )
+        # Un résultat antérieur à une mutation du document n'est pas mémorisé
+        if cache_ttl and self._generations.get(doc_id, 0) == generation:
+            self._sql_cache.set(cache_key, result, ttl=cache_ttl)
+        return result
+
     # --- Attachment Methods ---
     
     async def list_attachments(self, doc_id: str, sort: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -482,75 +852,73 @@ class GristClient:
         if limit:
             params["limit"] = limit
         
-        logger.debug(f"Listing attachments for document {doc_id}")
+        logger.debug("Listing attachments for document %s", doc_id)
         data = await self._request("GET", f"/docs/{doc_id}/attachments", params=params)
         return data.get("records", [])
     
     async def get_attachment_metadata(self, doc_id: str, attachment_id: int) -> Dict[str, Any]:
         """Obtient les métadonnées d'une pièce jointe spécifique."""
-        logger.debug(f"Getting metadata for attachment {attachment_id} in document {doc_id}")
+        logger.debug("Getting metadata for attachment %s in document %s", attachment_id, doc_id)
         return await self._request("GET", f"/docs/{doc_id}/attachments/{attachment_id}")
     
     async def download_attachment(self, doc_id: str, attachment_id: int) -> bytes:
         """Télécharge le contenu d'une pièce jointe."""
-        logger.debug(f"Downloading attachment {attachment_id} from document {doc_id}")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method="GET",
-                url=f"{self.api_url.rstrip('/')}/docs/{doc_id}/attachments/{attachment_id}/download",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.content
+        logger.debug("Downloading attachment %s from document %s", attachment_id, doc_id)
+        return await self._download(f"/docs/{doc_id}/attachments/{attachment_id}/download", timeout=60.0)
     
     async def upload_attachments(self, doc_id: str, files: List[tuple]) -> List[int]:
         """Téléverse des pièces jointes dans un document."""
-        logger.debug(f"Uploading {len(files)} attachments to document {doc_id}")
+        logger.debug("Uploading %s attachments to document %s", len(files), doc_id)
         
         # Prepare multipart form data
         files_data = []
         for filename, content, content_type in files:
             files_data.append(('upload', (filename, content, content_type)))
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.request(
+        try:
+            response = await self._get_http().request(
                 method="POST",
-                url=f"{self.api_url.rstrip('/')}/docs/{doc_id}/attachments",
-                headers={k: v for k, v in self.headers.items() if k != "Content-Type"},  # Remove Content-Type for multipart
-                files=files_data
+                url=f"{self._base_url}/docs/{doc_id}/attachments",
+                headers=self._upload_headers,
+                files=files_data,
+                timeout=120.0
             )
-            response.raise_for_status()
-            data = response.json()
-            return data
+        finally:
+            # Le téléversement ne passe pas par _fetch : invalider ici, comme
+            # pour toute mutation, même si la réponse n'a pas été reçue
+            self._invalidate_doc_cache(f"/docs/{doc_id}/attachments")
+        response.raise_for_status()
+        data = response.json()
+        return data
 
     # --- Webhook Methods ---
     
     async def list_webhooks(self, doc_id: str) -> List[Dict[str, Any]]:
         """Liste tous les webhooks d'un document."""
-        logger.debug(f"Listing webhooks for document {doc_id}")
+        logger.debug("Listing webhooks for document %s", doc_id)
         data = await self._request("GET", f"/docs/{doc_id}/webhooks")
         return data.get("webhooks", [])
     
     async def create_webhooks(self, doc_id: str, webhooks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Crée de nouveaux webhooks pour un document."""
-        logger.debug(f"Creating {len(webhooks)} webhooks for document {doc_id}")
+        logger.debug("Creating %s webhooks for document %s", len(webhooks), doc_id)
         webhook_data = {"webhooks": [{"fields": webhook} for webhook in webhooks]}
         data = await self._request("POST", f"/docs/{doc_id}/webhooks", json_data=webhook_data)
         return data.get("webhooks", [])
     
     async def modify_webhook(self, doc_id: str, webhook_id: str, webhook_data: Dict[str, Any]) -> None:
         """Modifie un webhook."""
-        logger.debug(f"Modifying webhook {webhook_id} for document {doc_id}")
+        logger.debug("Modifying webhook %s for document %s", webhook_id, doc_id)
         await self._request("PATCH", f"/docs/{doc_id}/webhooks/{webhook_id}", json_data=webhook_data)
     
     async def delete_webhook(self, doc_id: str, webhook_id: str) -> Dict[str, Any]:
         """Supprime un webhook."""
-        logger.debug(f"Deleting webhook {webhook_id} for document {doc_id}")
+        logger.debug("Deleting webhook %s for document %s", webhook_id, doc_id)
         return await self._request("DELETE", f"/docs/{doc_id}/webhooks/{webhook_id}")
     
     async def clear_webhook_queue(self, doc_id: str) -> None:
         """Vide la file d'attente des webhooks pour un document."""
-        logger.debug(f"Clearing webhook queue for document {doc_id}")
+        logger.debug("Clearing webhook queue for document %s", doc_id)
         await self._request("DELETE", f"/docs/{doc_id}/webhooks/queue")
 
     # --- Helper Methods for Validation and Error Enhancement ---
@@ -560,10 +928,14 @@ class GristClient:
         try:
             tables = await self.list_tables(doc_id)
             table_ids = [table.id for table in tables]
+            if table_id not in table_ids:
+                # La liste mémorisée peut précéder une modification faite hors
+                # de ce serveur (interface Grist) : relire une fois avant de refuser
+                tables = await self.list_tables(doc_id, refresh=True)
+                table_ids = [table.id for table in tables]
             
             if table_id not in table_ids:
                 # Find closest match
-                import difflib
                 closest = difflib.get_close_matches(table_id, table_ids, n=1, cutoff=0.6)
                 return {
                     "exists": False,
@@ -579,14 +951,19 @@ class GristClient:
         """Valide si des colonnes existent et retourne des informations utiles si ce n'est pas le cas."""
         try:
             columns = await self.list_columns(doc_id, table_id)
+            if not set(column_names) <= {col.id for col in columns}:
+                # La liste mémorisée peut précéder une modification faite hors
+                # de ce serveur (interface Grist) : relire une fois avant de refuser
+                columns = await self.list_columns(doc_id, table_id, refresh=True)
             available_columns = [col.id for col in columns]
+            available_ids = set(available_columns)
             column_labels = {col.fields.get('label', col.id): col.id for col in columns}
             
             missing_columns = []
             suggestions = {}
             
             for col_name in column_names:
-                if col_name not in available_columns:
+                if col_name not in available_ids:
                     # Check if it's a label instead of ID
                     if col_name in column_labels:
                         suggestions[col_name] = {
@@ -596,7 +973,6 @@ class GristClient:
                         }
                     else:
                         # Find closest match
-                        import difflib
                         closest = difflib.get_close_matches(col_name, available_columns, n=1, cutoff=0.6)
                         missing_columns.append(col_name)
                         if closest:
@@ -624,35 +1000,41 @@ class GristClient:
         try:
             columns = await self.list_columns(doc_id, table_id)
             
-            formula_map = {
-                "columns": [],
-                "id_to_label": {},
-                "label_to_id": {},
-                "formula_references": {},
-                "case_variants": {}
-            }
+            column_list = []
+            id_to_label = {}
+            label_to_id = {}
+            formula_references = {}
+            case_variants = {}
             
             for col in columns:
                 col_id = col.id
-                col_label = col.fields.get('label', col_id)
+                fields = col.fields
+                col_label = fields.get('label', col_id)
+                formula_ref = f"${col_id}"
                 
                 # Mappings de base
-                formula_map["columns"].append({
+                column_list.append({
                     "id": col_id,
                     "label": col_label,
-                    "type": col.fields.get('type', 'Text'),
-                    "formula_ref": f"${col_id}"
+                    "type": fields.get('type', 'Text'),
+                    "formula_ref": formula_ref
                 })
                 
-                formula_map["id_to_label"][col_id] = col_label
-                formula_map["label_to_id"][col_label] = col_id
-                formula_map["formula_references"][col_label] = f"${col_id}"
+                id_to_label[col_id] = col_label
+                label_to_id[col_label] = col_id
+                formula_references[col_label] = formula_ref
                 
                 # Variantes de casse pour détection d'erreurs
-                formula_map["case_variants"][col_id.lower()] = col_id
-                formula_map["case_variants"][col_label.lower()] = col_id
+                case_variants[col_id.lower()] = col_id
+                case_variants[col_label.lower()] = col_id
             
-            return formula_map
+            return {
+                "columns": column_list,
+                "id_to_label": id_to_label,
+                "label_to_id": label_to_id,
+                "formula_references": formula_references,
+                "case_variants": case_variants
+            }
         except Exception as e:
             return {"error": f"Could not generate formula map: {str(e)}"}
     
@@ -663,33 +1045,32 @@ class GristClient:
             if "error" in formula_map:
                 return formula_map
             
-            import re
-            
             # Extraire les références de colonnes dans la formule
-            column_refs = re.findall(r'\$([A-Za-z_][A-Za-z0-9_]*)', formula)
+            column_refs = _COLUMN_REF_RE.findall(formula)
             
             issues = []
             suggestions = []
-            corrected_formula = formula
+            corrections = {}
+            
+            id_to_label = formula_map["id_to_label"]
+            case_variants = formula_map["case_variants"]
             
             for ref in column_refs:
                 # Vérifier si la référence existe exactement
-                if ref not in formula_map["id_to_label"]:
+                if ref not in id_to_label:
                     # Chercher des variantes de casse
-                    ref_lower = ref.lower()
-                    if ref_lower in formula_map["case_variants"]:
-                        correct_ref = formula_map["case_variants"][ref_lower]
+                    correct_ref = case_variants.get(ref.lower())
+                    if correct_ref is not None:
                         issues.append({
                             "type": "case_error",
                             "found": f"${ref}",
                             "correct": f"${correct_ref}",
                             "message": f"Case mismatch: use ${correct_ref} instead of ${ref}"
                         })
-                        corrected_formula = corrected_formula.replace(f"${ref}", f"${correct_ref}")
+                        corrections[ref] = correct_ref
                     else:
                         # Chercher des correspondances approximatives
-                        import difflib
-                        available_ids = list(formula_map["id_to_label"].keys())
+                        available_ids = list(id_to_label)
                         closest = difflib.get_close_matches(ref, available_ids, n=1, cutoff=0.6)
                         
                         issues.append({
@@ -700,10 +1081,18 @@ class GristClient:
                             "available_columns": [f"${col_id}" for col_id in available_ids]
                         })
             
+            # Appliquer toutes les corrections en une seule passe
+            corrected_formula = None
+            if corrections:
+                corrected_formula = _COLUMN_REF_RE.sub(
+                    lambda m: "$" + corrections.get(m.group(1), m.group(1)),
+                    formula
+                )
+            
             return {
                 "valid": len(issues) == 0,
                 "original_formula": formula,
-                "corrected_formula": corrected_formula if corrected_formula != formula else None,
+                "corrected_formula": corrected_formula,
                 "issues": issues,
                 "formula_map": formula_map
             }
@@ -712,10 +1101,28 @@ class GristClient:
             return {"valid": False, "error": f"Could not validate formula: {str(e)}"}
 
 
+def _env_positive_int(name: str) -> Optional[int]:
+    """Lit un entier strictement positif dans l'environnement (None si absent ou invalide)."""
+    raw = os.environ.get(name)
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning("Valeur invalide pour %s: %s (valeur par défaut utilisée)", name, raw)
+        return None
+    return value
+
+
 def get_client(ctx=None) -> GristClient:
     """
     Obtient un client Grist configuré.
     
+    Les clients sont mis en cache par configuration afin de réutiliser
+    leurs connexions HTTP d'un appel d'outil à l'autre.
+    
     Args:
         ctx: Contexte MCP optionnel.
         
@@ -725,11 +1132,18 @@ def get_client(ctx=None) -> GristClient:
     Raises:
         ValueError: Si la variable d'environnement GRIST_API_KEY n'est pas définie.
     """
-    # Charger les variables d'environnement
-    load_dotenv()
+    global _dotenv_loaded
+    
+    # Charger les variables d'environnement (une seule fois par processus)
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
     
     api_key = os.environ.get("GRIST_API_KEY", "")
     api_url = os.environ.get("GRIST_API_URL", os.environ.get("GRIST_API_HOST", "https://docs.getgrist.com/api"))
+    backend = os.environ.get("GRIST_HTTP_BACKEND", "httpx").lower()
+    http2 = os.environ.get("GRIST_HTTP2", "").lower() in ("1", "true", "yes")
+    max_connections = _env_positive_int("GRIST_MAX_CONNECTIONS")
     
     if not api_key:
         raise ValueError("GRIST_API_KEY environment variable is not set")
@@ -738,5 +1152,19 @@ def get_client(ctx=None) -> GristClient:
     if not api_url.startswith("http"):
         api_url = "https://" + api_url
     
-    logger.debug(f"Creating Grist client with API URL: {api_url}")
-    return GristClient(api_key=api_key, api_url=api_url)
+    key = (api_key, api_url, backend, http2, max_connections)
+    client = _clients.get(key)
+    if client is None:
+        logger.debug("Creating Grist client with API URL: %s", api_url)
+        client = GristClient(api_key=api_key, api_url=api_url, backend=backend, http2=http2,
+                             max_connections=max_connections)
+        _clients[key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Ferme les clients Grist partagés et leurs connexions HTTP."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
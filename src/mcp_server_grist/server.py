@@ -7,11 +7,13 @@ appropriés pour interagir avec l'API Grist.
 
 import logging
 import os
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from .client import close_clients
 from .tools import register_all_tools
 from .version import __version__
 
@@ -45,6 +47,31 @@ def init_logging(debug: bool = False):
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+# Nombre de cycles de vie actifs : selon la version de FastMCP, le cycle de vie
+# est ouvert une fois par processus ou une fois par session (SSE, streamable-http)
+_active_lifespans = 0
+
+
+@asynccontextmanager
+async def grist_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, str]]:
+    """
+    Cycle de vie du serveur MCP.
+    
+    Les clients Grist conservent un client HTTP persistant pour toute la durée
+    du processus, partagé entre les sessions ; ils ne sont fermés qu'à la sortie
+    du dernier cycle de vie actif.
+    """
+    global _active_lifespans
+    _active_lifespans += 1
+    try:
+        yield {}
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await close_clients()
+            logger.debug("Clients HTTP Grist fermés")
+
+
 def create_mcp_server(debug: bool = False, parameters: Optional[Dict[str, str]] = None) -> FastMCP:
     """
     Crée et configure une instance du serveur MCP.
@@ -81,7 +108,8 @@ def create_mcp_server(debug: bool = False, parameters: Optional[Dict[str, str]]
     # Configurer le serveur MCP
     mcp = FastMCP(
         name="GristMCP",
-        version=__version__
+        version=__version__,
+        lifespan=grist_lifespan
     )
     
     # Les versions récentes de FastMCP n'utilisent plus set_system_message
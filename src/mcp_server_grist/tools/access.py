@@ -13,6 +13,10 @@ from ..client import get_client
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
 
+# Niveaux d'accès acceptés ("null" retire l'accès)
+_ORG_ACCESS_LEVELS = frozenset({"owners", "editors", "viewers", "members", "null"})
+_ACCESS_LEVELS = frozenset({"owners", "editors", "viewers", "null"})
+
 
 def register_access_tools(mcp_server):
     """
@@ -52,7 +56,7 @@ async def list_organization_access(
     Returns:
         Dict avec statut, message et détails des accès
     """
-    logger.info(f"Tool called: list_organization_access with org_id: {org_id}")
+    logger.info("Tool called: list_organization_access with org_id: %s", org_id)
     
     try:
         client = get_client(ctx)
@@ -70,7 +74,7 @@ async def list_organization_access(
             "access": access_info
         }
     except Exception as e:
-        logger.error(f"Error listing organization access: {e}")
+        logger.error("Error listing organization access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des accès à l'organisation: {str(e)}"
@@ -98,7 +102,7 @@ async def modify_organization_access(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_organization_access with org_id: {org_id}, user_email: {user_email}")
+    logger.info("Tool called: modify_organization_access with org_id: %s, user_email: %s", org_id, user_email)
     
     try:
         client = get_client(ctx)
@@ -108,7 +112,7 @@ async def modify_organization_access(
                 "message": "Client Grist non configuré"
             }
         
-        if access_level not in ["owners", "editors", "viewers", "members", "null"]:
+        if access_level not in _ORG_ACCESS_LEVELS:
             return {
                 "success": False,
                 "message": "Niveau d'accès invalide. Doit être: owners, editors, viewers, members, ou null"
@@ -128,7 +132,7 @@ async def modify_organization_access(
             "message": f"Accès pour {user_email} {action} avec succès"
         }
     except Exception as e:
-        logger.error(f"Error modifying organization access: {e}")
+        logger.error("Error modifying organization access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la modification des accès à l'organisation: {str(e)}"
@@ -153,7 +157,7 @@ async def list_workspace_access(
     Returns:
         Dict avec statut, message et détails des accès
     """
-    logger.info(f"Tool called: list_workspace_access with workspace_id: {workspace_id}")
+    logger.info("Tool called: list_workspace_access with workspace_id: %s", workspace_id)
     
     try:
         client = get_client(ctx)
@@ -171,7 +175,7 @@ async def list_workspace_access(
             "access": access_info
         }
     except Exception as e:
-        logger.error(f"Error listing workspace access: {e}")
+        logger.error("Error listing workspace access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des accès à l'espace de travail: {str(e)}"
@@ -199,7 +203,7 @@ async def modify_workspace_access(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_workspace_access with workspace_id: {workspace_id}, user_email: {user_email}")
+    logger.info("Tool called: modify_workspace_access with workspace_id: %s, user_email: %s", workspace_id, user_email)
     
     try:
         client = get_client(ctx)
@@ -209,7 +213,7 @@ async def modify_workspace_access(
                 "message": "Client Grist non configuré"
             }
         
-        if access_level not in ["owners", "editors", "viewers", "null"]:
+        if access_level not in _ACCESS_LEVELS:
             return {
                 "success": False,
                 "message": "Niveau d'accès invalide. Doit être: owners, editors, viewers, ou null"
@@ -229,7 +233,7 @@ async def modify_workspace_access(
             "message": f"Accès pour {user_email} {action} avec succès"
         }
     except Exception as e:
-        logger.error(f"Error modifying workspace access: {e}")
+        logger.error("Error modifying workspace access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la modification des accès à l'espace de travail: {str(e)}"
@@ -254,7 +258,7 @@ async def list_document_access(
     Returns:
         Dict avec statut, message et détails des accès
     """
-    logger.info(f"Tool called: list_document_access with doc_id: {doc_id}")
+    logger.info("Tool called: list_document_access with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -272,7 +276,7 @@ async def list_document_access(
             "access": access_info
         }
     except Exception as e:
-        logger.error(f"Error listing document access: {e}")
+        logger.error("Error listing document access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des accès au document: {str(e)}"
@@ -300,7 +304,7 @@ async def modify_document_access(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_document_access with doc_id: {doc_id}, user_email: {user_email}")
+    logger.info("Tool called: modify_document_access with doc_id: %s, user_email: %s", doc_id, user_email)
     
     try:
         client = get_client(ctx)
@@ -310,7 +314,7 @@ async def modify_document_access(
                 "message": "Client Grist non configuré"
             }
         
-        if access_level not in ["owners", "editors", "viewers", "null"]:
+        if access_level not in _ACCESS_LEVELS:
             return {
                 "success": False,
                 "message": "Niveau d'accès invalide. Doit être: owners, editors, viewers, ou null"
@@ -330,7 +334,7 @@ async def modify_document_access(
             "message": f"Accès pour {user_email} {action} avec succès"
         }
     except Exception as e:
-        logger.error(f"Error modifying document access: {e}")
+        logger.error("Error modifying document access: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la modification des accès au document: {str(e)}"
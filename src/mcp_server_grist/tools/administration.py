@@ -9,6 +9,7 @@ import logging
 from typing import Any, Dict, List, Optional, Union
 
 from ..client import get_client
+from .common import tool_errors
 
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
@@ -40,16 +41,19 @@ def register_admin_tools(mcp_server):
     
     # Table
     mcp_server.tool()(create_table)
+    mcp_server.tool()(create_tables)
     mcp_server.tool()(modify_table)
     
     # Column
     mcp_server.tool()(create_column)
+    mcp_server.tool()(create_columns)
     mcp_server.tool()(modify_column)
     mcp_server.tool()(delete_column)
 
 
 # --- Organisation Management ---
 
+@tool_errors("modifying organization", "Erreur lors de la modification de l'organisation")
 async def modify_organization(
     org_id: Union[int, str], 
     name: Optional[str] = None,
@@ -68,40 +72,34 @@ async def modify_organization(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_organization with org_id: {org_id}")
+    logger.info("Tool called: modify_organization with org_id: %s", org_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        org_data = {}
-        if name is not None:
-            org_data["name"] = name
-        
-        if not org_data:
-            return {
-                "success": False,
-                "message": "Aucune donnée de modification fournie"
-            }
-        
-        await client.modify_org(org_id, org_data)
-        
+    client = get_client(ctx)
+    if not client:
         return {
-            "success": True,
-            "message": f"Organisation {org_id} modifiée avec succès"
+            "success": False,
+            "message": "Client Grist non configuré"
         }
-    except Exception as e:
-        logger.error(f"Error modifying organization: {e}")
+    
+    org_data = {}
+    if name is not None:
+        org_data["name"] = name
+    
+    if not org_data:
         return {
             "success": False,
-            "message": f"Erreur lors de la modification de l'organisation: {str(e)}"
+            "message": "Aucune donnée de modification fournie"
         }
+    
+    await client.modify_org(org_id, org_data)
+    
+    return {
+        "success": True,
+        "message": f"Organisation {org_id} modifiée avec succès"
+    }
 
 
+@tool_errors("deleting organization", "Erreur lors de la suppression de l'organisation")
 async def delete_organization(
     org_id: Union[int, str], 
     ctx=None
@@ -119,32 +117,26 @@ async def delete_organization(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_organization with org_id: {org_id}")
+    logger.info("Tool called: delete_organization with org_id: %s", org_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.delete_org(org_id)
-        
-        return {
-            "success": True,
-            "message": f"Organisation {org_id} supprimée avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error deleting organization: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la suppression de l'organisation: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.delete_org(org_id)
+    
+    return {
+        "success": True,
+        "message": f"Organisation {org_id} supprimée avec succès"
+    }
 
 
 # --- Workspace Management ---
 
+@tool_errors("creating workspace", "Erreur lors de la création de l'espace de travail")
 async def create_workspace(
     org_id: Union[int, str], 
     name: str,
@@ -168,32 +160,26 @@ async def create_workspace(
     Returns:
         Dict avec statut, message et ID de l'espace de travail créé
     """
-    logger.info(f"Tool called: create_workspace with org_id: {org_id}, name: {name}")
+    logger.info("Tool called: create_workspace with org_id: %s, name: %s", org_id, name)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        workspace_data = {"name": name}
-        workspace_id = await client.create_workspace(org_id, workspace_data)
-        
-        return {
-            "success": True,
-            "message": f"Espace de travail '{name}' créé avec succès",
-            "workspace_id": workspace_id
-        }
-    except Exception as e:
-        logger.error(f"Error creating workspace: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la création de l'espace de travail: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    workspace_data = {"name": name}
+    workspace_id = await client.create_workspace(org_id, workspace_data)
+    
+    return {
+        "success": True,
+        "message": f"Espace de travail '{name}' créé avec succès",
+        "workspace_id": workspace_id
+    }
 
 
+@tool_errors("modifying workspace", "Erreur lors de la modification de l'espace de travail")
 async def modify_workspace(
     workspace_id: int, 
     name: Optional[str] = None,
@@ -212,40 +198,34 @@ async def modify_workspace(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_workspace with workspace_id: {workspace_id}")
+    logger.info("Tool called: modify_workspace with workspace_id: %s", workspace_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        workspace_data = {}
-        if name is not None:
-            workspace_data["name"] = name
-        
-        if not workspace_data:
-            return {
-                "success": False,
-                "message": "Aucune donnée de modification fournie"
-            }
-        
-        await client.modify_workspace(workspace_id, workspace_data)
-        
+    client = get_client(ctx)
+    if not client:
         return {
-            "success": True,
-            "message": f"Espace de travail {workspace_id} modifié avec succès"
+            "success": False,
+            "message": "Client Grist non configuré"
         }
-    except Exception as e:
-        logger.error(f"Error modifying workspace: {e}")
+    
+    workspace_data = {}
+    if name is not None:
+        workspace_data["name"] = name
+    
+    if not workspace_data:
         return {
             "success": False,
-            "message": f"Erreur lors de la modification de l'espace de travail: {str(e)}"
+            "message": "Aucune donnée de modification fournie"
         }
+    
+    await client.modify_workspace(workspace_id, workspace_data)
+    
+    return {
+        "success": True,
+        "message": f"Espace de travail {workspace_id} modifié avec succès"
+    }
 
 
+@tool_errors("deleting workspace", "Erreur lors de la suppression de l'espace de travail")
 async def delete_workspace(
     workspace_id: int, 
     ctx=None
@@ -263,32 +243,26 @@ async def delete_workspace(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_workspace with workspace_id: {workspace_id}")
+    logger.info("Tool called: delete_workspace with workspace_id: %s", workspace_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.delete_workspace(workspace_id)
-        
-        return {
-            "success": True,
-            "message": f"Espace de travail {workspace_id} supprimé avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error deleting workspace: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la suppression de l'espace de travail: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.delete_workspace(workspace_id)
+    
+    return {
+        "success": True,
+        "message": f"Espace de travail {workspace_id} supprimé avec succès"
+    }
 
 
 # --- Document Management ---
 
+@tool_errors("creating document", "Erreur lors de la création du document")
 async def create_document(
     workspace_id: int, 
     name: str,
@@ -312,32 +286,26 @@ async def create_document(
     Returns:
         Dict avec statut, message et ID du document créé
     """
-    logger.info(f"Tool called: create_document with workspace_id: {workspace_id}, name: {name}")
+    logger.info("Tool called: create_document with workspace_id: %s, name: %s", workspace_id, name)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        doc_data = {"name": name}
-        doc_id = await client.create_doc(workspace_id, doc_data)
-        
-        return {
-            "success": True,
-            "message": f"Document '{name}' créé avec succès",
-            "doc_id": doc_id
-        }
-    except Exception as e:
-        logger.error(f"Error creating document: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la création du document: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    doc_data = {"name": name}
+    doc_id = await client.create_doc(workspace_id, doc_data)
+    
+    return {
+        "success": True,
+        "message": f"Document '{name}' créé avec succès",
+        "doc_id": doc_id
+    }
 
 
+@tool_errors("modifying document", "Erreur lors de la modification du document")
 async def modify_document(
     doc_id: str, 
     name: Optional[str] = None,
@@ -358,42 +326,36 @@ async def modify_document(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_document with doc_id: {doc_id}")
+    logger.info("Tool called: modify_document with doc_id: %s", doc_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        doc_data = {}
-        if name is not None:
-            doc_data["name"] = name
-        if is_pinned is not None:
-            doc_data["isPinned"] = is_pinned
-        
-        if not doc_data:
-            return {
-                "success": False,
-                "message": "Aucune donnée de modification fournie"
-            }
-        
-        await client.modify_doc(doc_id, doc_data)
-        
+    client = get_client(ctx)
+    if not client:
         return {
-            "success": True,
-            "message": f"Document {doc_id} modifié avec succès"
+            "success": False,
+            "message": "Client Grist non configuré"
         }
-    except Exception as e:
-        logger.error(f"Error modifying document: {e}")
+    
+    doc_data = {}
+    if name is not None:
+        doc_data["name"] = name
+    if is_pinned is not None:
+        doc_data["isPinned"] = is_pinned
+    
+    if not doc_data:
         return {
             "success": False,
-            "message": f"Erreur lors de la modification du document: {str(e)}"
+            "message": "Aucune donnée de modification fournie"
         }
+    
+    await client.modify_doc(doc_id, doc_data)
+    
+    return {
+        "success": True,
+        "message": f"Document {doc_id} modifié avec succès"
+    }
 
 
+@tool_errors("deleting document", "Erreur lors de la suppression du document")
 async def delete_document(
     doc_id: str, 
     ctx=None
@@ -411,30 +373,24 @@ async def delete_document(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_document with doc_id: {doc_id}")
+    logger.info("Tool called: delete_document with doc_id: %s", doc_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.delete_doc(doc_id)
-        
-        return {
-            "success": True,
-            "message": f"Document {doc_id} supprimé avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error deleting document: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la suppression du document: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.delete_doc(doc_id)
+    
+    return {
+        "success": True,
+        "message": f"Document {doc_id} supprimé avec succès"
+    }
 
 
+@tool_errors("moving document", "Erreur lors du déplacement du document")
 async def move_document(
     doc_id: str, 
     target_workspace_id: int,
@@ -454,30 +410,24 @@ async def move_document(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: move_document with doc_id: {doc_id}, target_workspace_id: {target_workspace_id}")
+    logger.info("Tool called: move_document with doc_id: %s, target_workspace_id: %s", doc_id, target_workspace_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.move_doc(doc_id, target_workspace_id)
-        
-        return {
-            "success": True,
-            "message": f"Document {doc_id} déplacé vers l'espace de travail {target_workspace_id} avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error moving document: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors du déplacement du document: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.move_doc(doc_id, target_workspace_id)
+    
+    return {
+        "success": True,
+        "message": f"Document {doc_id} déplacé vers l'espace de travail {target_workspace_id} avec succès"
+    }
 
 
+@tool_errors("reloading document", "Erreur lors du rechargement du document")
 async def force_reload_document(
     doc_id: str, 
     ctx=None
@@ -493,30 +443,24 @@ async def force_reload_document(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: force_reload_document with doc_id: {doc_id}")
+    logger.info("Tool called: force_reload_document with doc_id: %s", doc_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.force_reload_doc(doc_id)
-        
-        return {
-            "success": True,
-            "message": f"Document {doc_id} rechargé avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error reloading document: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors du rechargement du document: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.force_reload_doc(doc_id)
+    
+    return {
+        "success": True,
+        "message": f"Document {doc_id} rechargé avec succès"
+    }
 
 
+@tool_errors("deleting document history", "Erreur lors de la suppression de l'historique du document")
 async def delete_document_history(
     doc_id: str, 
     keep: int = 1000,
@@ -534,32 +478,34 @@ async def delete_document_history(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_document_history with doc_id: {doc_id}, keep: {keep}")
+    logger.info("Tool called: delete_document_history with doc_id: %s, keep: %s", doc_id, keep)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.delete_doc_history(doc_id, keep)
-        
-        return {
-            "success": True,
-            "message": f"Historique du document {doc_id} supprimé avec succès, conservant {keep} actions récentes"
-        }
-    except Exception as e:
-        logger.error(f"Error deleting document history: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la suppression de l'historique du document: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    await client.delete_doc_history(doc_id, keep)
+    
+    return {
+        "success": True,
+        "message": f"Historique du document {doc_id} supprimé avec succès, conservant {keep} actions récentes"
+    }
 
 
 # --- Table Management ---
 
+def _table_payload(table_id: str, columns: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Construit la définition d'une table pour l'endpoint POST /tables."""
+    return {
+        "tableId": table_id,
+        "columns": columns or []
+    }
+
+
+@tool_errors("creating table", "Erreur lors de la création de la table")
 async def create_table(
     doc_id: str, 
     table_id: str,
@@ -586,40 +532,95 @@ async def create_table(
     Returns:
         Dict avec statut, message et détails de la table créée
     """
-    logger.info(f"Tool called: create_table with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: create_table with doc_id: %s, table_id: %s", doc_id, table_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        table_data = {
-            "tables": [
-                {
-                    "tableId": table_id,
-                    "columns": columns or []
-                }
-            ]
+    client = get_client(ctx)
+    if not client:
+        return {
+            "success": False,
+            "message": "Client Grist non configuré"
         }
+    
+    table_data = {"tables": [_table_payload(table_id, columns)]}
+    
+    result = await client.create_tables(doc_id, table_data)
+    
+    return {
+        "success": True,
+        "message": f"Table '{table_id}' créée avec succès",
+        "table": result[0] if result else None
+    }
+
+
+@tool_errors("creating tables", "Erreur lors de la création des tables")
+async def create_tables(
+    doc_id: str,
+    tables: List[Dict[str, Any]],
+    ctx=None
+) -> Dict[str, Any]:
+    """
+    Crée plusieurs tables, avec leurs colonnes, en une seule requête.
+    
+    Prérequis:
+        - list_documents: Pour obtenir un doc_id valide
+    
+    Flux de travail typique:
+        1. list_documents(workspace_id) → obtenir doc_id
+        2. create_tables(doc_id, tables=[...]) → créer toutes les tables
+        3. list_tables(doc_id) → vérifier la création
+    
+    Args:
+        doc_id: L'ID du document
+        tables: Liste des tables à créer, chacune avec un "table_id" et
+                des "columns" optionnelles
+                Exemple: [{"table_id": "Clients", "columns": [{"id": "nom", "type": "Text"}]},
+                          {"table_id": "Commandes", "columns": [{"id": "montant", "type": "Numeric"}]}]
         
-        result = await client.create_tables(doc_id, table_data)
-        
+    Returns:
+        Dict avec statut, message et détails des tables créées
+    """
+    logger.info("Tool called: create_tables with doc_id: %s, %s tables", doc_id, len(tables))
+    
+    client = get_client(ctx)
+    if not client:
         return {
-            "success": True,
-            "message": f"Table '{table_id}' créée avec succès",
-            "table": result[0] if result else None
+            "success": False,
+            "message": "Client Grist non configuré"
         }
-    except Exception as e:
-        logger.error(f"Error creating table: {e}")
+    
+    if not tables:
         return {
             "success": False,
-            "message": f"Erreur lors de la création de la table: {str(e)}"
+            "message": "Aucune table à créer"
         }
+    
+    table_ids = []
+    for table in tables:
+        table_id = table.get("table_id") or table.get("tableId") or table.get("id")
+        if not table_id:
+            return {
+                "success": False,
+                "message": "Chaque table doit avoir un 'table_id'"
+            }
+        table_ids.append(table_id)
+    
+    table_data = {
+        "tables": [
+            _table_payload(table_id, table.get("columns"))
+            for table_id, table in zip(table_ids, tables)
+        ]
+    }
+    
+    result = await client.create_tables(doc_id, table_data)
+    
+    return {
+        "success": True,
+        "message": f"{len(table_ids)} tables créées avec succès: {', '.join(table_ids)}",
+        "tables": result or []
+    }
 
 
+@tool_errors("modifying table", "Erreur lors de la modification de la table")
 async def modify_table(
     doc_id: str, 
     table_id: str,
@@ -640,47 +641,65 @@ async def modify_table(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_table with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: modify_table with doc_id: %s, table_id: %s", doc_id, table_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        table_data = {
-            "tables": [
-                {
-                    "tableId": table_id
-                }
-            ]
-        }
-        
-        if new_table_id:
-            table_data["tables"][0]["newTableId"] = new_table_id
-        
-        await client.modify_tables(doc_id, table_data)
-        
-        message = f"Table {table_id} modifiée avec succès"
-        if new_table_id:
-            message += f" (renommée en '{new_table_id}')"
-        
-        return {
-            "success": True,
-            "message": message
-        }
-    except Exception as e:
-        logger.error(f"Error modifying table: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la modification de la table: {str(e)}"
+            "message": "Client Grist non configuré"
         }
+    
+    table_data = {
+        "tables": [
+            {
+                "tableId": table_id
+            }
+        ]
+    }
+    
+    if new_table_id:
+        table_data["tables"][0]["newTableId"] = new_table_id
+    
+    await client.modify_tables(doc_id, table_data)
+    
+    message = f"Table {table_id} modifiée avec succès"
+    if new_table_id:
+        message += f" (renommée en '{new_table_id}')"
+    
+    return {
+        "success": True,
+        "message": message
+    }
 
 
 # --- Column Management ---
 
+def _column_payload(
+    column_id: str,
+    column_type: str = "Text",
+    label: Optional[str] = None,
+    formula: Optional[str] = None,
+    widget_options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Construit la définition d'une colonne pour l'endpoint POST /columns."""
+    column = {
+        "id": column_id,
+        "type": column_type
+    }
+    
+    # Ajouter les champs optionnels s'ils sont fournis
+    if label:
+        column["label"] = label
+    if formula:
+        column["formula"] = formula
+        column["isFormula"] = True
+    if widget_options:
+        column["widgetOptions"] = widget_options
+    return column
+
+
+@tool_errors("creating column", "Erreur lors de la création de la colonne")
 async def create_column(
     doc_id: str, 
     table_id: str,
@@ -714,49 +733,105 @@ async def create_column(
     Returns:
         Dict avec statut, message et détails de la colonne créée
     """
-    logger.info(f"Tool called: create_column with doc_id: {doc_id}, table_id: {table_id}, column_id: {column_id}")
+    logger.info("Tool called: create_column with doc_id: %s, table_id: %s, column_id: %s", doc_id, table_id, column_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        column_data = {
-            "columns": [
-                {
-                    "id": column_id,
-                    "type": column_type
-                }
-            ]
+    client = get_client(ctx)
+    if not client:
+        return {
+            "success": False,
+            "message": "Client Grist non configuré"
         }
+    
+    column_data = {
+        "columns": [_column_payload(column_id, column_type, label, formula, widget_options)]
+    }
+    
+    result = await client.create_columns(doc_id, table_id, column_data)
+    
+    return {
+        "success": True,
+        "message": f"Colonne '{column_id}' créée avec succès",
+        "column": result[0] if result else None
+    }
+
+
+@tool_errors("creating columns", "Erreur lors de la création des colonnes")
+async def create_columns(
+    doc_id: str,
+    table_id: str,
+    columns: List[Dict[str, Any]],
+    ctx=None
+) -> Dict[str, Any]:
+    """
+    Crée plusieurs colonnes dans une table en une seule requête.
+    
+    Prérequis:
+        - list_tables: Pour obtenir un table_id valide
+    
+    Flux de travail typique:
+        1. list_tables(doc_id) → obtenir table_id
+        2. create_columns(doc_id, table_id, columns=[...]) → créer toutes les colonnes
+        3. list_columns(doc_id, table_id) → vérifier la création
+    
+    Args:
+        doc_id: L'ID du document
+        table_id: L'ID de la table
+        columns: Liste des colonnes à créer, chacune avec un "column_id" et
+                 optionnellement "type", "label", "formula" et "widget_options"
+                 Exemple: [{"column_id": "nom", "type": "Text", "label": "Nom"},
+                           {"column_id": "total", "type": "Numeric", "formula": "$prix * $quantite"}]
         
-        # Ajouter les champs optionnels s'ils sont fournis
-        if label:
-            column_data["columns"][0]["label"] = label
-        if formula:
-            column_data["columns"][0]["formula"] = formula
-            column_data["columns"][0]["isFormula"] = True
-        if widget_options:
-            column_data["columns"][0]["widgetOptions"] = widget_options
-        
-        result = await client.create_columns(doc_id, table_id, column_data)
-        
+    Returns:
+        Dict avec statut, message et détails des colonnes créées
+    """
+    logger.info("Tool called: create_columns with doc_id: %s, table_id: %s, %s columns", doc_id, table_id, len(columns))
+    
+    client = get_client(ctx)
+    if not client:
         return {
-            "success": True,
-            "message": f"Colonne '{column_id}' créée avec succès",
-            "column": result[0] if result else None
+            "success": False,
+            "message": "Client Grist non configuré"
         }
-    except Exception as e:
-        logger.error(f"Error creating column: {e}")
+    
+    if not columns:
         return {
             "success": False,
-            "message": f"Erreur lors de la création de la colonne: {str(e)}"
+            "message": "Aucune colonne à créer"
         }
-
-
+    
+    column_ids = []
+    for column in columns:
+        column_id = column.get("column_id") or column.get("id")
+        if not column_id:
+            return {
+                "success": False,
+                "message": "Chaque colonne doit avoir un 'column_id'"
+            }
+        column_ids.append(column_id)
+    
+    column_data = {
+        "columns": [
+            _column_payload(
+                column_id,
+                column.get("type", "Text"),
+                column.get("label"),
+                column.get("formula"),
+                column.get("widget_options")
+            )
+            for column_id, column in zip(column_ids, columns)
+        ]
+    }
+    
+    result = await client.create_columns(doc_id, table_id, column_data)
+    
+    return {
+        "success": True,
+        "message": f"{len(column_ids)} colonnes créées avec succès dans la table {table_id}: {', '.join(column_ids)}",
+        "columns": result
+    }
+
+
+@tool_errors("modifying column", "Erreur lors de la modification de la colonne")
 async def modify_column(
     doc_id: str, 
     table_id: str,
@@ -787,55 +862,49 @@ async def modify_column(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_column with doc_id: {doc_id}, table_id: {table_id}, column_id: {column_id}")
+    logger.info("Tool called: modify_column with doc_id: %s, table_id: %s, column_id: %s", doc_id, table_id, column_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        column_data = {
-            "columns": [
-                {
-                    "id": column_id
-                }
-            ]
-        }
-        
-        # Ajouter les champs à modifier s'ils sont fournis
-        if new_column_id:
-            column_data["columns"][0]["newId"] = new_column_id
-        if column_type:
-            column_data["columns"][0]["type"] = column_type
-        if label:
-            column_data["columns"][0]["label"] = label
-        if formula is not None:  # Permettre de vider la formule avec une chaîne vide
-            column_data["columns"][0]["formula"] = formula
-            column_data["columns"][0]["isFormula"] = bool(formula)
-        if widget_options:
-            column_data["columns"][0]["widgetOptions"] = widget_options
-        
-        await client.modify_columns(doc_id, table_id, column_data)
-        
-        message = f"Colonne '{column_id}' modifiée avec succès"
-        if new_column_id:
-            message += f" (renommée en '{new_column_id}')"
-        
-        return {
-            "success": True,
-            "message": message
-        }
-    except Exception as e:
-        logger.error(f"Error modifying column: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la modification de la colonne: {str(e)}"
+            "message": "Client Grist non configuré"
         }
-
-
+    
+    column_data = {
+        "columns": [
+            {
+                "id": column_id
+            }
+        ]
+    }
+    
+    # Ajouter les champs à modifier s'ils sont fournis
+    if new_column_id:
+        column_data["columns"][0]["newId"] = new_column_id
+    if column_type:
+        column_data["columns"][0]["type"] = column_type
+    if label:
+        column_data["columns"][0]["label"] = label
+    if formula is not None:  # Permettre de vider la formule avec une chaîne vide
+        column_data["columns"][0]["formula"] = formula
+        column_data["columns"][0]["isFormula"] = bool(formula)
+    if widget_options:
+        column_data["columns"][0]["widgetOptions"] = widget_options
+    
+    await client.modify_columns(doc_id, table_id, column_data)
+    
+    message = f"Colonne '{column_id}' modifiée avec succès"
+    if new_column_id:
+        message += f" (renommée en '{new_column_id}')"
+    
+    return {
+        "success": True,
+        "message": message
+    }
+
+
+@tool_errors("deleting column", "Erreur lors de la suppression de la colonne")
 async def delete_column(
     doc_id: str, 
     table_id: str,
@@ -857,25 +926,18 @@ async def delete_column(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_column with doc_id: {doc_id}, table_id: {table_id}, column_id: {column_id}")
+    logger.info("Tool called: delete_column with doc_id: %s, table_id: %s, column_id: %s", doc_id, table_id, column_id)
     
-    try:
-        client = get_client(ctx)
-        if not client:
-            return {
-                "success": False,
-                "message": "Client Grist non configuré"
-            }
-        
-        await client.delete_column(doc_id, table_id, column_id)
-        
-        return {
-            "success": True,
-            "message": f"Colonne '{column_id}' supprimée avec succès"
-        }
-    except Exception as e:
-        logger.error(f"Error deleting column: {e}")
+    client = get_client(ctx)
+    if not client:
         return {
             "success": False,
-            "message": f"Erreur lors de la suppression de la colonne: {str(e)}"
-        }
\ No newline at end of file
+            "message": "Client Grist non configuré"
+        }
+    
+    await client.delete_column(doc_id, table_id, column_id)
+    
+    return {
+        "success": True,
+        "message": f"Colonne '{column_id}' supprimée avec succès"
+    }
\ No newline at end of file
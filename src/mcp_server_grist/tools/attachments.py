@@ -5,6 +5,8 @@ Ce module contient des outils MCP pour gérer les pièces jointes
 dans les documents Grist: liste, téléchargement, téléversement.
 """
 
+import asyncio
+import base64
 import logging
 from typing import Any, Dict, List, Optional, Union
 
@@ -47,7 +49,7 @@ async def list_attachments(
     Returns:
         Dict avec statut, message et liste des pièces jointes
     """
-    logger.info(f"Tool called: list_attachments with doc_id: {doc_id}")
+    logger.info("Tool called: list_attachments with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -66,7 +68,7 @@ async def list_attachments(
             "attachments": attachments
         }
     except Exception as e:
-        logger.error(f"Error listing attachments: {e}")
+        logger.error("Error listing attachments: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des pièces jointes pour le document {doc_id}: {str(e)}",
@@ -92,7 +94,7 @@ async def get_attachment_info(
     Returns:
         Dict avec statut, message et métadonnées de la pièce jointe
     """
-    logger.info(f"Tool called: get_attachment_info with doc_id: {doc_id}, attachment_id: {attachment_id}")
+    logger.info("Tool called: get_attachment_info with doc_id: %s, attachment_id: %s", doc_id, attachment_id)
     
     try:
         client = get_client(ctx)
@@ -110,7 +112,7 @@ async def get_attachment_info(
             "attachment": attachment_info
         }
     except Exception as e:
-        logger.error(f"Error getting attachment info: {e}")
+        logger.error("Error getting attachment info: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des métadonnées de la pièce jointe: {str(e)}"
@@ -136,7 +138,7 @@ async def download_attachment(
     Returns:
         Dict avec statut, message et contenu encodé en base64
     """
-    logger.info(f"Tool called: download_attachment with doc_id: {doc_id}, attachment_id: {attachment_id}")
+    logger.info("Tool called: download_attachment with doc_id: %s, attachment_id: %s", doc_id, attachment_id)
     
     try:
         client = get_client(ctx)
@@ -146,14 +148,13 @@ async def download_attachment(
                 "message": "Client Grist non configuré"
             }
         
-        # Récupérer d'abord les métadonnées pour avoir le nom et le type
-        metadata = await client.get_attachment_metadata(doc_id, attachment_id)
-        
-        # Télécharger le contenu
-        content = await client.download_attachment(doc_id, attachment_id)
+        # Récupérer les métadonnées (nom, type) et le contenu en parallèle
+        metadata, content = await asyncio.gather(
+            client.get_attachment_metadata(doc_id, attachment_id),
+            client.download_attachment(doc_id, attachment_id)
+        )
         
         # Encoder le contenu binaire en base64
-        import base64
         encoded_content = base64.b64encode(content).decode('utf-8')
         
         filename = metadata.get("fileName", f"attachment_{attachment_id}")
@@ -168,7 +169,7 @@ async def download_attachment(
             "size_bytes": len(content)
         }
     except Exception as e:
-        logger.error(f"Error downloading attachment: {e}")
+        logger.error("Error downloading attachment: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du téléchargement de la pièce jointe: {str(e)}"
@@ -197,7 +198,7 @@ async def upload_attachment(
     Returns:
         Dict avec statut, message et ID de la pièce jointe créée
     """
-    logger.info(f"Tool called: upload_attachment with doc_id: {doc_id}, filename: {filename}")
+    logger.info("Tool called: upload_attachment with doc_id: %s, filename: %s", doc_id, filename)
     
     try:
         client = get_client(ctx)
@@ -208,7 +209,6 @@ async def upload_attachment(
             }
         
         # Décoder le contenu base64
-        import base64
         content = base64.b64decode(content_base64)
         
         # Préparer les données pour le téléversement
@@ -225,7 +225,7 @@ async def upload_attachment(
             "attachment_ids": attachment_ids
         }
     except Exception as e:
-        logger.error(f"Error uploading attachment: {e}")
+        logger.error("Error uploading attachment: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du téléversement de la pièce jointe: {str(e)}"
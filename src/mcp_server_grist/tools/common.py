@@ -0,0 +1,41 @@
+"""
+Utilitaires communs aux outils MCP.
+
+Ce module centralise la gestion des erreurs partagée par les outils
+afin que chaque outil ne décrive que son chemin de succès.
+"""
+
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+# Configurer le logger
+logger = logging.getLogger("grist_mcp_server")
+
+ToolFunc = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+def tool_errors(log_label: str, error_message: str) -> Callable[[ToolFunc], ToolFunc]:
+    """
+    Convertit les exceptions levées par un outil en réponse d'erreur.
+
+    Args:
+        log_label: Libellé de l'opération pour les logs (ex: "creating table")
+        error_message: Préfixe du message retourné (ex: "Erreur lors de la création de la table")
+
+    Returns:
+        Un décorateur préservant la signature de l'outil (nécessaire à FastMCP)
+    """
+    def decorator(fn: ToolFunc) -> ToolFunc:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error %s: %s", log_label, e)
+                return {
+                    "success": False,
+                    "message": f"{error_message}: {e}"
+                }
+        return wrapper
+    return decorator
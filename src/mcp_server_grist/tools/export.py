@@ -14,6 +14,9 @@ from ..client import get_client
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
 
+# Formats d'en-tête acceptés par les exports Grist
+_VALID_HEADERS = frozenset({"label", "id", "none"})
+
 
 def register_export_tools(mcp_server):
     """
@@ -47,7 +50,7 @@ async def download_document_sqlite(
     Returns:
         Dict avec statut, message et contenu encodé en base64
     """
-    logger.info(f"Tool called: download_document_sqlite with doc_id: {doc_id}")
+    logger.info("Tool called: download_document_sqlite with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -71,7 +74,7 @@ async def download_document_sqlite(
             "size_bytes": len(content)
         }
     except Exception as e:
-        logger.error(f"Error downloading document as SQLite: {e}")
+        logger.error("Error downloading document as SQLite: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du téléchargement du document au format SQLite: {str(e)}"
@@ -96,7 +99,7 @@ async def download_document_excel(
     Returns:
         Dict avec statut, message et contenu encodé en base64
     """
-    logger.info(f"Tool called: download_document_excel with doc_id: {doc_id}")
+    logger.info("Tool called: download_document_excel with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -106,7 +109,7 @@ async def download_document_excel(
                 "message": "Client Grist non configuré"
             }
         
-        if header not in ["label", "id", "none"]:
+        if header not in _VALID_HEADERS:
             return {
                 "success": False,
                 "message": "Format d'en-tête invalide. Doit être: label, id, ou none"
@@ -126,7 +129,7 @@ async def download_document_excel(
             "size_bytes": len(content)
         }
     except Exception as e:
-        logger.error(f"Error downloading document as Excel: {e}")
+        logger.error("Error downloading document as Excel: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du téléchargement du document au format Excel: {str(e)}"
@@ -154,7 +157,7 @@ async def download_table_csv(
     Returns:
         Dict avec statut, message et contenu CSV
     """
-    logger.info(f"Tool called: download_table_csv with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: download_table_csv with doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -164,13 +167,13 @@ async def download_table_csv(
                 "message": "Client Grist non configuré"
             }
         
-        if header not in ["label", "id", "none"]:
+        if header not in _VALID_HEADERS:
             return {
                 "success": False,
                 "message": "Format d'en-tête invalide. Doit être: label, id, ou none"
             }
         
-        content = await client.download_table_csv(doc_id, table_id, header=header)
+        content = await client.download_doc_csv(doc_id, table_id, header=header)
         
         return {
             "success": True,
@@ -181,7 +184,7 @@ async def download_table_csv(
             "size_bytes": len(content.encode('utf-8'))
         }
     except Exception as e:
-        logger.error(f"Error downloading table as CSV: {e}")
+        logger.error("Error downloading table as CSV: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du téléchargement de la table au format CSV: {str(e)}"
@@ -70,7 +70,7 @@ async def list_organizations(ctx) -> Dict[str, Any]:
             "organizations": [org.model_dump() for org in orgs]
         }
     except Exception as e:
-        logger.error(f"Error listing organizations: {e}")
+        logger.error("Error listing organizations: %s", e)
         return {
             "success": False,
             "message": f"Error listing organizations: {str(e)}",
@@ -98,7 +98,7 @@ async def describe_organization(org_id: Union[int, str], ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - organization (Dict): Détails de l'organisation
     """
-    logger.info(f"Tool called: describe_organization with org_id: {org_id}")
+    logger.info("Tool called: describe_organization with org_id: %s", org_id)
     
     try:
         client = get_client(ctx)
@@ -116,7 +116,7 @@ async def describe_organization(org_id: Union[int, str], ctx) -> Dict[str, Any]:
             "organization": org_details
         }
     except Exception as e:
-        logger.error(f"Error describing organization: {e}")
+        logger.error("Error describing organization: %s", e)
         return {
             "success": False,
             "message": f"Error describing organization {org_id}: {str(e)}"
@@ -149,7 +149,7 @@ async def list_workspaces(org_id: Union[int, str], ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - workspaces (List): Liste des espaces de travail
     """
-    logger.info(f"Tool called: list_workspaces with org_id: {org_id}")
+    logger.info("Tool called: list_workspaces with org_id: %s", org_id)
     
     try:
         client = get_client(ctx)
@@ -168,7 +168,7 @@ async def list_workspaces(org_id: Union[int, str], ctx) -> Dict[str, Any]:
             "workspaces": [workspace.model_dump() for workspace in workspaces]
         }
     except Exception as e:
-        logger.error(f"Error listing workspaces: {e}")
+        logger.error("Error listing workspaces: %s", e)
         return {
             "success": False,
             "message": f"Error listing workspaces for organization {org_id}: {str(e)}",
@@ -197,7 +197,7 @@ async def describe_workspace(workspace_id: int, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - workspace (Dict): Détails de l'espace de travail
     """
-    logger.info(f"Tool called: describe_workspace with workspace_id: {workspace_id}")
+    logger.info("Tool called: describe_workspace with workspace_id: %s", workspace_id)
     
     try:
         client = get_client(ctx)
@@ -215,7 +215,7 @@ async def describe_workspace(workspace_id: int, ctx) -> Dict[str, Any]:
             "workspace": workspace_details
         }
     except Exception as e:
-        logger.error(f"Error describing workspace: {e}")
+        logger.error("Error describing workspace: %s", e)
         return {
             "success": False,
             "message": f"Error describing workspace {workspace_id}: {str(e)}"
@@ -248,7 +248,7 @@ async def list_documents(workspace_id: int, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - documents (List): Liste des documents
     """
-    logger.info(f"Tool called: list_documents with workspace_id: {workspace_id}")
+    logger.info("Tool called: list_documents with workspace_id: %s", workspace_id)
     
     try:
         client = get_client(ctx)
@@ -267,7 +267,7 @@ async def list_documents(workspace_id: int, ctx) -> Dict[str, Any]:
             "documents": [document.model_dump() for document in documents]
         }
     except Exception as e:
-        logger.error(f"Error listing documents: {e}")
+        logger.error("Error listing documents: %s", e)
         return {
             "success": False,
             "message": f"Error listing documents for workspace {workspace_id}: {str(e)}",
@@ -295,7 +295,7 @@ async def describe_document(doc_id: str, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - document (Dict): Détails du document
     """
-    logger.info(f"Tool called: describe_document with doc_id: {doc_id}")
+    logger.info("Tool called: describe_document with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -313,7 +313,7 @@ async def describe_document(doc_id: str, ctx) -> Dict[str, Any]:
             "document": document_details
         }
     except Exception as e:
-        logger.error(f"Error describing document: {e}")
+        logger.error("Error describing document: %s", e)
         return {
             "success": False,
             "message": f"Error describing document {doc_id}: {str(e)}"
@@ -345,7 +345,7 @@ async def list_tables(doc_id: str, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - tables (List): Liste des tables
     """
-    logger.info(f"Tool called: list_tables with doc_id: {doc_id}")
+    logger.info("Tool called: list_tables with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -364,7 +364,7 @@ async def list_tables(doc_id: str, ctx) -> Dict[str, Any]:
             "tables": [table.model_dump() for table in tables]
         }
     except Exception as e:
-        logger.error(f"Error listing tables: {e}")
+        logger.error("Error listing tables: %s", e)
         return {
             "success": False,
             "message": f"Error listing tables for document {doc_id}: {str(e)}",
@@ -398,7 +398,7 @@ async def list_columns(doc_id: str, table_id: str, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - columns (List): Liste des colonnes
     """
-    logger.info(f"Tool called: list_columns with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: list_columns with doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -417,7 +417,7 @@ async def list_columns(doc_id: str, table_id: str, ctx) -> Dict[str, Any]:
             "columns": [column.model_dump() for column in columns]
         }
     except Exception as e:
-        logger.error(f"Error listing columns: {e}")
+        logger.error("Error listing columns: %s", e)
         return {
             "success": False,
             "message": f"Error listing columns for table {table_id} in document {doc_id}: {str(e)}",
@@ -460,7 +460,7 @@ async def list_records(
             - records (List): Liste des enregistrements
             - record_count (int): Nombre total d'enregistrements retournés
     """
-    logger.info(f"Tool called: list_records with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: list_records with doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -484,7 +484,7 @@ async def list_records(
             "record_count": len(records)
         }
     except Exception as e:
-        logger.error(f"Error listing records: {e}")
+        logger.error("Error listing records: %s", e)
         return {
             "success": False,
             "message": f"Error listing records for table {table_id} in document {doc_id}: {str(e)}",
@@ -517,7 +517,7 @@ async def get_table_schema(doc_id: str, table_id: str, ctx) -> Dict[str, Any]:
             - message (str): Message de succès ou d'erreur
             - schema (Dict): Schéma détaillé de la table au format frictionless
     """
-    logger.info(f"Tool called: get_table_schema with doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: get_table_schema with doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -535,7 +535,7 @@ async def get_table_schema(doc_id: str, table_id: str, ctx) -> Dict[str, Any]:
             "schema": schema
         }
     except Exception as e:
-        logger.error(f"Error getting table schema: {e}")
+        logger.error("Error getting table schema: %s", e)
         return {
             "success": False,
             "message": f"Error getting schema for table {table_id} in document {doc_id}: {str(e)}"
@@ -14,6 +14,9 @@ from ..client import get_client
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
 
+# Seules les requêtes de lecture sont acceptées
+_SELECT_RE = re.compile(r'^SELECT\s', re.IGNORECASE)
+
 
 def register_query_tools(mcp_server):
     """
@@ -34,6 +37,8 @@ async def filter_sql_query(
     where_conditions: Optional[Dict[str, Any]] = None,
     order_by: Optional[str] = None,
     limit: Optional[int] = None,
+    use_cache: bool = True,
+    cache_ttl_s: float = 30.0,
     ctx=None
 ) -> Dict[str, Any]:
     """
@@ -64,6 +69,14 @@ async def filter_sql_query(
         - Tri: order_by="nom" ou order_by="valeur DESC"
         - Pagination: limit=20
         - Colonnes spécifiques: columns=["nom", "valeur", "date"]
+        - Lecture fraîche après des modifications externes: use_cache=False
+    
+    Cache:
+        - Les résultats sont mémorisés pendant cache_ttl_s secondes (30 par défaut)
+        - Toute modification du document via ce serveur invalide le cache
+        - Une modification faite ailleurs (interface Grist, autre client API)
+          peut rester invisible jusqu'à cache_ttl_s secondes
+        - Passez use_cache=False pour forcer une lecture fraîche
     
     Args:
         doc_id: ID du document
@@ -72,11 +85,15 @@ async def filter_sql_query(
         where_conditions: Dict de conditions (AND implicite entre conditions)
         order_by: Colonne de tri avec direction optionnelle (ex: "nom DESC")
         limit: Nombre max de résultats
+        use_cache: Réutiliser un résultat récent pour la même requête (défaut: True) ;
+            une modification faite hors de ce serveur peut rester invisible
+            jusqu'à cache_ttl_s secondes
+        cache_ttl_s: Durée de validité du résultat mémorisé en secondes (défaut: 30)
         
     Returns:
         Dict avec les enregistrements filtrés et métadonnées de requête
     """
-    logger.info(f"Tool called: filter_sql_query for doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: filter_sql_query for doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         # Construire la requête SQL
@@ -106,16 +123,22 @@ async def filter_sql_query(
         if limit is not None:
             sql_query += f" LIMIT {limit}"
         
-        # Exécuter la requête SQL générée via execute_sql_query
-        return await execute_sql_query(
-            doc_id=doc_id,
-            sql_query=sql_query,
-            parameters=params,
-            ctx=ctx
-        )
+        client = get_client(ctx)
+        if not client:
+            return {
+                "success": False,
+                "message": "Client Grist non configuré",
+                "query": sql_query,
+                "records": [],
+                "record_count": 0
+            }
+        
+        # La requête générée est un SELECT : pas de nouvelle validation
+        return await _run_sql(client, doc_id, sql_query, params,
+                              use_cache=use_cache, cache_ttl_s=cache_ttl_s)
         
     except Exception as e:
-        logger.error(f"Error in filter_sql_query: {str(e)}")
+        logger.error("Error in filter_sql_query: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du filtrage SQL: {str(e)}",
@@ -130,6 +153,8 @@ async def execute_sql_query(
     sql_query: str,
     parameters: Optional[List[Any]] = None,
     timeout_ms: Optional[int] = 1000,
+    use_cache: bool = True,
+    cache_ttl_s: float = 30.0,
     ctx=None
 ) -> Dict[str, Any]:
     """
@@ -154,21 +179,32 @@ async def execute_sql_query(
         - Utilisez toujours des paramètres liés (?) pour les valeurs variables
         - Seules les requêtes SELECT sont autorisées
     
+    Cache:
+        - Les résultats sont mémorisés pendant cache_ttl_s secondes (30 par défaut)
+        - Toute modification du document via ce serveur invalide le cache
+        - Une modification faite ailleurs (interface Grist, autre client API)
+          peut rester invisible jusqu'à cache_ttl_s secondes
+        - Passez use_cache=False pour forcer une lecture fraîche
+    
     Args:
         doc_id: ID du document
         sql_query: Requête SQL à exécuter (SELECT uniquement)
         parameters: Liste des paramètres pour les placeholders '?' dans la requête
         timeout_ms: Délai d'expiration en millisecondes (défaut: 1000)
+        use_cache: Réutiliser un résultat récent pour la même requête (défaut: True) ;
+            une modification faite hors de ce serveur peut rester invisible
+            jusqu'à cache_ttl_s secondes
+        cache_ttl_s: Durée de validité du résultat mémorisé en secondes (défaut: 30)
         
     Returns:
         Dict avec les résultats de la requête et métadonnées
     """
-    logger.info(f"Tool called: execute_sql_query for doc_id: {doc_id}")
+    logger.info("Tool called: execute_sql_query for doc_id: %s", doc_id)
     
     try:
         # Vérifier que la requête est une requête SELECT
-        sql_query = sql_query.strip()
-        if not re.match(r'^SELECT\s', sql_query, re.IGNORECASE):
+        sql_query = sql_query.strip().rstrip(";").rstrip()
+        if not _SELECT_RE.match(sql_query):
             return {
                 "success": False,
                 "message": "Seules les requêtes SELECT sont autorisées pour des raisons de sécurité.",
@@ -187,42 +223,12 @@ async def execute_sql_query(
                 "record_count": 0
             }
         
-        # Préparer la requête SQL
-        query_data = {
-            "sql": sql_query,
-            "args": parameters or []
-        }
-        
-        if timeout_ms:
-            query_data["timeout"] = timeout_ms
-        
-        # Exécuter la requête SQL
-        response = await client._request(
-            method="POST",
-            endpoint=f"/docs/{doc_id}/sql",
-            json_data=query_data
-        )
-        
-        # Extraire et formater les résultats
-        statement = response.get("statement", sql_query)
-        records = response.get("records", [])
-        
-        # Ajouter des IDs si nécessaire
-        for i, record in enumerate(records):
-            if "id" not in record:
-                record["id"] = i + 1
-        
-        return {
-            "success": True,
-            "message": f"Requête SQL exécutée avec succès. {len(records)} enregistrements trouvés.",
-            "query": sql_query,
-            "statement": statement,
-            "records": records,
-            "record_count": len(records)
-        }
+        return await _run_sql(client, doc_id, sql_query, parameters,
+                              timeout_ms=timeout_ms, use_cache=use_cache,
+                              cache_ttl_s=cache_ttl_s)
         
     except Exception as e:
-        logger.error(f"Error in execute_sql_query: {str(e)}")
+        logger.error("Error in execute_sql_query: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de l'exécution de la requête SQL: {str(e)}",
@@ -230,3 +236,55 @@ async def execute_sql_query(
             "records": [],
             "record_count": 0
         }
+
+
+async def _run_sql(
+    client,
+    doc_id: str,
+    sql_query: str,
+    parameters: Optional[List[Any]] = None,
+    timeout_ms: Optional[int] = 1000,
+    use_cache: bool = True,
+    cache_ttl_s: float = 30.0
+) -> Dict[str, Any]:
+    """
+    Exécute une requête SELECT déjà validée et met en forme le résultat.
+    
+    Partagé par execute_sql_query et filter_sql_query, qui effectuent
+    chacun leur propre validation en amont. Avec use_cache, le résultat peut
+    ignorer pendant cache_ttl_s secondes les modifications faites hors de ce
+    serveur ; celles faites via ce serveur invalident le cache.
+    """
+    # Réutiliser un résultat récent si possible
+    response = client.cached_sql_result(doc_id, sql_query, parameters) if use_cache else None
+    cached = response is not None
+    
+    # Exécuter la requête SQL
+    if not cached:
+        response = await client.sql_query(
+            doc_id,
+            sql_query,
+            parameters,
+            timeout_ms=timeout_ms,
+            cache_ttl=cache_ttl_s if use_cache else None
+        )
+    
+    # Extraire et formater les résultats
+    statement = response.get("statement", sql_query)
+    
+    # Ajouter des IDs si nécessaire, sur des copies : la réponse peut être
+    # partagée avec le cache des requêtes SQL
+    records = [
+        record if "id" in record else {**record, "id": i + 1}
+        for i, record in enumerate(response.get("records", []))
+    ]
+    
+    return {
+        "success": True,
+        "message": f"Requête SQL exécutée avec succès. {len(records)} enregistrements trouvés.",
+        "query": sql_query,
+        "statement": statement,
+        "records": records,
+        "record_count": len(records),
+        "cached": cached
+    }
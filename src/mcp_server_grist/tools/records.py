@@ -5,6 +5,7 @@ Ce module contient des outils MCP pour manipuler les enregistrements
 dans les tables Grist: ajout, mise à jour et suppression.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Union
 
@@ -52,7 +53,7 @@ async def add_grist_records(
             "record_ids": [1, 2, 3]  # IDs des enregistrements créés
         }
     """
-    logger.info(f"Tool called: add_grist_records for doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: add_grist_records for doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -71,11 +72,12 @@ async def add_grist_records(
             "record_ids": record_ids
         }
     except Exception as e:
-        logger.error(f"Error in add_grist_records: {str(e)}")
+        logger.error("Error in add_grist_records: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de l'ajout des enregistrements: {str(e)}",
-            "record_ids": []
+            # IDs déjà insérés si l'insertion découpée a été interrompue
+            "record_ids": getattr(e, "record_ids", [])
         }
 
 
@@ -108,7 +110,7 @@ async def add_grist_records_safe(
         Dict avec statut, message, éventuellement des suggestions de correction,
         et IDs des enregistrements créés si l'opération a réussi
     """
-    logger.info(f"Tool called: add_grist_records_safe for doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: add_grist_records_safe for doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -119,8 +121,21 @@ async def add_grist_records_safe(
                 "record_ids": []
             }
         
+        # Extraire tous les noms de colonnes utilisés
+        validate_columns = bool(records and isinstance(records, list))
+        column_names = set().union(*records) if validate_columns else set()
+        
+        # Les deux validations sont indépendantes : les exécuter en parallèle
+        if validate_columns:
+            table_validation, columns_validation = await asyncio.gather(
+                client.validate_table_exists(doc_id, table_id),
+                client.validate_columns_exist(doc_id, table_id, list(column_names))
+            )
+        else:
+            table_validation = await client.validate_table_exists(doc_id, table_id)
+            columns_validation = {"valid": True}
+        
         # Validation 1: Vérifier si la table existe
-        table_validation = await client.validate_table_exists(doc_id, table_id)
         if not table_validation.get("exists", False):
             return {
                 "success": False,
@@ -130,24 +145,16 @@ async def add_grist_records_safe(
                 "record_ids": []
             }
         
-        # Validation 2: Vérifier les noms de colonnes si des enregistrements sont fournis
-        if records and isinstance(records, list) and len(records) > 0:
-            # Extraire tous les noms de colonnes utilisés
-            column_names = set()
-            for record in records:
-                column_names.update(record.keys())
-            
-            # Valider l'existence des colonnes
-            columns_validation = await client.validate_columns_exist(doc_id, table_id, list(column_names))
-            if not columns_validation.get("valid", True) and "error" not in columns_validation:
-                return {
-                    "success": False,
-                    "message": f"Some columns do not exist in table '{table_id}'",
-                    "missing_columns": columns_validation.get("missing_columns", []),
-                    "suggestions": columns_validation.get("suggestions", {}),
-                    "available_columns": columns_validation.get("available_columns", []),
-                    "record_ids": []
-                }
+        # Validation 2: Vérifier les noms de colonnes
+        if not columns_validation.get("valid", True) and "error" not in columns_validation:
+            return {
+                "success": False,
+                "message": f"Some columns do not exist in table '{table_id}'",
+                "missing_columns": columns_validation.get("missing_columns", []),
+                "suggestions": columns_validation.get("suggestions", {}),
+                "available_columns": columns_validation.get("available_columns", []),
+                "record_ids": []
+            }
         
         # Si tout est valide, ajouter les enregistrements
         record_ids = await client.add_records(doc_id, table_id, records)
@@ -158,11 +165,12 @@ async def add_grist_records_safe(
             "record_ids": record_ids
         }
     except Exception as e:
-        logger.error(f"Error in add_grist_records_safe: {str(e)}")
+        logger.error("Error in add_grist_records_safe: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de l'ajout sécurisé des enregistrements: {str(e)}",
-            "record_ids": []
+            # IDs déjà insérés si l'insertion découpée a été interrompue
+            "record_ids": getattr(e, "record_ids", [])
         }
 
 
@@ -192,7 +200,7 @@ async def update_grist_records(
     Returns:
         Dict avec statut, message et IDs des enregistrements mis à jour
     """
-    logger.info(f"Tool called: update_grist_records for doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: update_grist_records for doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -203,14 +211,15 @@ async def update_grist_records(
                 "record_ids": []
             }
         
-        # Vérifier que tous les enregistrements ont un ID
-        for i, record in enumerate(records):
-            if "id" not in record:
-                return {
-                    "success": False,
-                    "message": f"L'enregistrement à l'index {i} n'a pas d'ID. Chaque enregistrement doit contenir un champ 'id'.",
-                    "record_ids": []
-                }
+        # Vérifier que tous les enregistrements ont un ID (l'index fautif
+        # n'est recherché qu'en cas d'échec)
+        if not all("id" in record for record in records):
+            i = next(i for i, record in enumerate(records) if "id" not in record)
+            return {
+                "success": False,
+                "message": f"L'enregistrement à l'index {i} n'a pas d'ID. Chaque enregistrement doit contenir un champ 'id'.",
+                "record_ids": []
+            }
         
         record_ids = await client.update_records(doc_id, table_id, records)
         
@@ -220,7 +229,7 @@ async def update_grist_records(
             "record_ids": record_ids
         }
     except Exception as e:
-        logger.error(f"Error in update_grist_records: {str(e)}")
+        logger.error("Error in update_grist_records: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la mise à jour des enregistrements: {str(e)}",
@@ -252,7 +261,7 @@ async def delete_grist_records(
     Returns:
         Dict avec statut et message de confirmation
     """
-    logger.info(f"Tool called: delete_grist_records for doc_id: {doc_id}, table_id: {table_id}")
+    logger.info("Tool called: delete_grist_records for doc_id: %s, table_id: %s", doc_id, table_id)
     
     try:
         client = get_client(ctx)
@@ -262,13 +271,17 @@ async def delete_grist_records(
                 "message": "Client Grist non configuré"
             }
         
-        # Vérifier que tous les IDs sont des entiers
-        for i, record_id in enumerate(record_ids):
-            if not isinstance(record_id, int):
-                return {
-                    "success": False,
-                    "message": f"L'ID à l'index {i} ({record_id}) n'est pas un entier. Tous les IDs doivent être des entiers."
-                }
+        # Vérifier que tous les IDs sont des entiers (l'ID fautif
+        # n'est recherché qu'en cas d'échec)
+        if not all(isinstance(record_id, int) for record_id in record_ids):
+            i, record_id = next(
+                (i, record_id) for i, record_id in enumerate(record_ids)
+                if not isinstance(record_id, int)
+            )
+            return {
+                "success": False,
+                "message": f"L'ID à l'index {i} ({record_id}) n'est pas un entier. Tous les IDs doivent être des entiers."
+            }
         
         await client.delete_records(doc_id, table_id, record_ids)
         
@@ -277,7 +290,7 @@ async def delete_grist_records(
             "message": f"{len(record_ids)} enregistrements supprimés avec succès"
         }
     except Exception as e:
-        logger.error(f"Error in delete_grist_records: {str(e)}")
+        logger.error("Error in delete_grist_records: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la suppression des enregistrements: {str(e)}"
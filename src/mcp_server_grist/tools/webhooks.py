@@ -13,6 +13,10 @@ from ..client import get_client
 # Configurer le logger
 logger = logging.getLogger("grist_mcp_server")
 
+# Types d'événements déclencheurs acceptés par les webhooks Grist
+_EVENT_TYPES = ["add", "update", "delete"]
+_VALID_EVENT_TYPES = frozenset(_EVENT_TYPES)
+
 
 def register_webhook_tools(mcp_server):
     """
@@ -41,7 +45,7 @@ async def list_webhooks(doc_id: str, ctx=None) -> Dict[str, Any]:
     Returns:
         Dict avec statut, message et liste des webhooks
     """
-    logger.info(f"Tool called: list_webhooks with doc_id: {doc_id}")
+    logger.info("Tool called: list_webhooks with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -60,7 +64,7 @@ async def list_webhooks(doc_id: str, ctx=None) -> Dict[str, Any]:
             "webhooks": webhooks
         }
     except Exception as e:
-        logger.error(f"Error listing webhooks: {e}")
+        logger.error("Error listing webhooks: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la récupération des webhooks pour le document {doc_id}: {str(e)}",
@@ -94,7 +98,7 @@ async def create_webhook(
     Returns:
         Dict avec statut, message et ID du webhook créé
     """
-    logger.info(f"Tool called: create_webhook with doc_id: {doc_id}, url: {url}")
+    logger.info("Tool called: create_webhook with doc_id: %s, url: %s", doc_id, url)
     
     try:
         client = get_client(ctx)
@@ -105,13 +109,12 @@ async def create_webhook(
             }
         
         # Valider les types d'événements
-        valid_event_types = ["add", "update", "delete"]
         if event_types:
             for event_type in event_types:
-                if event_type not in valid_event_types:
+                if event_type not in _VALID_EVENT_TYPES:
                     return {
                         "success": False,
-                        "message": f"Type d'événement invalide: {event_type}. Doit être parmi: {valid_event_types}"
+                        "message": f"Type d'événement invalide: {event_type}. Doit être parmi: {_EVENT_TYPES}"
                     }
         
         # Préparer les données du webhook
@@ -145,7 +148,7 @@ async def create_webhook(
                 "message": "Aucun webhook n'a été créé"
             }
     except Exception as e:
-        logger.error(f"Error creating webhook: {e}")
+        logger.error("Error creating webhook: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la création du webhook: {str(e)}"
@@ -180,7 +183,7 @@ async def modify_webhook(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: modify_webhook with doc_id: {doc_id}, webhook_id: {webhook_id}")
+    logger.info("Tool called: modify_webhook with doc_id: %s, webhook_id: %s", doc_id, webhook_id)
     
     try:
         client = get_client(ctx)
@@ -191,13 +194,12 @@ async def modify_webhook(
             }
         
         # Valider les types d'événements
-        valid_event_types = ["add", "update", "delete"]
         if event_types:
             for event_type in event_types:
-                if event_type not in valid_event_types:
+                if event_type not in _VALID_EVENT_TYPES:
                     return {
                         "success": False,
-                        "message": f"Type d'événement invalide: {event_type}. Doit être parmi: {valid_event_types}"
+                        "message": f"Type d'événement invalide: {event_type}. Doit être parmi: {_EVENT_TYPES}"
                     }
         
         # Préparer les données de modification
@@ -232,7 +234,7 @@ async def modify_webhook(
             "message": f"Webhook {webhook_id} modifié avec succès"
         }
     except Exception as e:
-        logger.error(f"Error modifying webhook: {e}")
+        logger.error("Error modifying webhook: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la modification du webhook: {str(e)}"
@@ -257,7 +259,7 @@ async def delete_webhook(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: delete_webhook with doc_id: {doc_id}, webhook_id: {webhook_id}")
+    logger.info("Tool called: delete_webhook with doc_id: %s, webhook_id: %s", doc_id, webhook_id)
     
     try:
         client = get_client(ctx)
@@ -274,7 +276,7 @@ async def delete_webhook(
             "message": f"Webhook {webhook_id} supprimé avec succès"
         }
     except Exception as e:
-        logger.error(f"Error deleting webhook: {e}")
+        logger.error("Error deleting webhook: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors de la suppression du webhook: {str(e)}"
@@ -296,7 +298,7 @@ async def clear_webhook_queue(
     Returns:
         Dict avec statut et message de l'opération
     """
-    logger.info(f"Tool called: clear_webhook_queue with doc_id: {doc_id}")
+    logger.info("Tool called: clear_webhook_queue with doc_id: %s", doc_id)
     
     try:
         client = get_client(ctx)
@@ -313,7 +315,7 @@ async def clear_webhook_queue(
             "message": f"File d'attente des webhooks vidée avec succès pour le document {doc_id}"
         }
     except Exception as e:
-        logger.error(f"Error clearing webhook queue: {e}")
+        logger.error("Error clearing webhook queue: %s", e)
         return {
             "success": False,
             "message": f"Erreur lors du vidage de la file d'attente des webhooks: {str(e)}"
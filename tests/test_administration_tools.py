@@ -0,0 +1,93 @@
+"""
+Tests pour les outils d'administration.
+
+Ce module teste les outils MCP pour la création et la modification d'objets Grist.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mcp_server_grist.tools.administration import create_columns, create_table, create_tables
+
+
+@pytest.mark.asyncio
+async def test_create_table(mock_grist_client, mock_ctx):
+    """Teste l'outil create_table."""
+    mock_grist_client.create_tables.return_value = [{"id": "Clients"}]
+    
+    with patch("mcp_server_grist.tools.administration.get_client", return_value=mock_grist_client):
+        result = await create_table("doc1", "Clients", [{"id": "nom", "type": "Text"}], mock_ctx)
+    
+    assert result["success"] is True
+    assert result["table"] == {"id": "Clients"}
+    mock_grist_client.create_tables.assert_called_once_with(
+        "doc1", {"tables": [{"tableId": "Clients", "columns": [{"id": "nom", "type": "Text"}]}]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_tables_single_request(mock_grist_client, mock_ctx):
+    """Teste que create_tables crée toutes les tables en un seul appel."""
+    mock_grist_client.create_tables.return_value = [{"id": "Clients"}, {"id": "Commandes"}]
+    tables = [
+        {"table_id": "Clients", "columns": [{"id": "nom", "type": "Text"}]},
+        {"table_id": "Commandes"}
+    ]
+    
+    with patch("mcp_server_grist.tools.administration.get_client", return_value=mock_grist_client):
+        result = await create_tables("doc1", tables, mock_ctx)
+    
+    assert result["success"] is True
+    assert len(result["tables"]) == 2
+    mock_grist_client.create_tables.assert_called_once_with("doc1", {
+        "tables": [
+            {"tableId": "Clients", "columns": [{"id": "nom", "type": "Text"}]},
+            {"tableId": "Commandes", "columns": []}
+        ]
+    })
+
+
+@pytest.mark.asyncio
+async def test_create_tables_missing_table_id(mock_grist_client, mock_ctx):
+    """Teste que create_tables refuse une table sans identifiant."""
+    with patch("mcp_server_grist.tools.administration.get_client", return_value=mock_grist_client):
+        result = await create_tables("doc1", [{"columns": []}], mock_ctx)
+    
+    assert result["success"] is False
+    mock_grist_client.create_tables.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_table_error(mock_grist_client, mock_ctx):
+    """Teste que les erreurs de l'API sont converties en réponse d'échec."""
+    mock_grist_client.create_tables.side_effect = ValueError("HTTP error: 400 - Bad Request")
+    
+    with patch("mcp_server_grist.tools.administration.get_client", return_value=mock_grist_client):
+        result = await create_table("doc1", "Clients", ctx=mock_ctx)
+    
+    assert result == {
+        "success": False,
+        "message": "Erreur lors de la création de la table: HTTP error: 400 - Bad Request"
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_columns_single_request(mock_grist_client, mock_ctx):
+    """Teste que create_columns crée toutes les colonnes en un seul appel."""
+    mock_grist_client.create_columns.return_value = [{"id": "nom"}, {"id": "total"}]
+    columns = [
+        {"column_id": "nom", "label": "Nom"},
+        {"column_id": "total", "type": "Numeric", "formula": "$prix * $quantite"}
+    ]
+    
+    with patch("mcp_server_grist.tools.administration.get_client", return_value=mock_grist_client):
+        result = await create_columns("doc1", "Table1", columns, mock_ctx)
+    
+    assert result["success"] is True
+    assert result["columns"] == [{"id": "nom"}, {"id": "total"}]
+    mock_grist_client.create_columns.assert_called_once_with("doc1", "Table1", {
+        "columns": [
+            {"id": "nom", "type": "Text", "label": "Nom"},
+            {"id": "total", "type": "Numeric", "formula": "$prix * $quantite", "isFormula": True}
+        ]
+    })
@@ -0,0 +1,51 @@
+"""
+Tests pour le regroupement asynchrone des requêtes.
+
+Ce module teste le répartiteur de lots utilisé pour fusionner les mutations concurrentes.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server_grist.batching import BatchDispatcher
+
+
+@pytest.mark.asyncio
+async def test_merged_batch_never_exceeds_max_batch():
+    """Teste qu'une soumission qui ferait déborder le lot part dans un nouveau lot."""
+    dispatcher = BatchDispatcher(max_wait_ms=5.0, max_batch=32)
+    sent = []
+
+    async def send(merged):
+        sent.append(len(merged))
+        return list(merged)
+
+    results = await asyncio.gather(
+        dispatcher.submit("key", list(range(20)), send),
+        dispatcher.submit("key", list(range(20)), send),
+        dispatcher.submit("key", list(range(500)), send),
+    )
+
+    assert sorted(sent) == [20, 20, 500]
+    assert [len(result) for result in results] == [20, 20, 500]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_keeps_running_batches_referenced():
+    """Teste que les envois en cours sont référencés jusqu'à leur fin."""
+    dispatcher = BatchDispatcher(max_wait_ms=0.0, max_batch=32)
+    release = asyncio.Event()
+
+    async def send(merged):
+        await release.wait()
+        return list(merged)
+
+    submission = asyncio.ensure_future(dispatcher.submit("key", [1], send))
+    await asyncio.sleep(0.01)
+    assert len(dispatcher._tasks) == 1
+
+    release.set()
+    assert await submission == [1]
+    await asyncio.sleep(0)
+    assert not dispatcher._tasks
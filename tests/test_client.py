@@ -4,6 +4,7 @@ Tests pour le client Grist.
 Ce module teste les fonctionnalités du client Grist pour l'API.
 """
 
+import asyncio
 import json
 import os
 import pytest
@@ -12,7 +13,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from mcp_server_grist.client import GristClient, get_client, mask_api_key
+from mcp_server_grist.client import GristClient, GristHTTPError, PartialInsertError, get_client, mask_api_key
+from mcp_server_grist.models import GristColumn
 
 
 @pytest.mark.asyncio
@@ -69,13 +71,13 @@ async def test_request_success():
     
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
-    mock_response.raise_for_status = MagicMock()
+    mock_response.content = b'{"data": "test"}'
     
     mock_client = AsyncMock()
+    mock_client.is_closed = False
     mock_client.request.return_value = mock_response
     
-    with patch("httpx.AsyncClient", return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_client), __aexit__=AsyncMock())):
+    with patch("httpx.AsyncClient", return_value=mock_client):
         result = await client._request("GET", "/test")
         
     assert result == {"data": "test"}
@@ -89,13 +91,11 @@ async def test_request_error_handling():
     
     # Mock du client HTTP qui lève une exception
     mock_client = AsyncMock()
+    mock_client.is_closed = False
     mock_client.request.side_effect = Exception("Test error")
     
     # Patch AsyncClient pour retourner notre mock
-    with patch("httpx.AsyncClient", return_value=AsyncMock(
-        __aenter__=AsyncMock(return_value=mock_client),
-        __aexit__=AsyncMock()
-    )):
+    with patch("httpx.AsyncClient", return_value=mock_client):
         # Le client doit gérer l'exception
         try:
             await client._request("GET", "/test")
@@ -105,6 +105,101 @@ async def test_request_error_handling():
             assert "Test error" in str(e)
 
 
+@pytest.mark.asyncio
+async def test_request_reuses_http_client():
+    """Teste que le client HTTP est créé une seule fois et réutilisé."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+    
+    mock_client = AsyncMock()
+    mock_client.is_closed = False
+    mock_client.request.return_value = mock_response
+    
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_factory:
+        await client._request("GET", "/test")
+        await client._request("GET", "/test")
+        await client.aclose()
+    
+    mock_factory.assert_called_once()
+    assert mock_client.request.call_count == 2
+    mock_client.aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_request_http_error_status():
+    """Teste qu'un statut d'erreur HTTP est converti en ValueError."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    mock_response.content = b"Not found"
+    
+    mock_client = AsyncMock()
+    mock_client.is_closed = False
+    mock_client.request.return_value = mock_response
+    
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        with pytest.raises(ValueError, match="HTTP error: 404 - Not found"):
+            await client._request("GET", "/test")
+
+
+@pytest.mark.asyncio
+async def test_request_aiohttp_backend():
+    """Teste le backend aiohttp avec une session simulée."""
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.read = AsyncMock(return_value=b'{"data": "test"}')
+    
+    mock_context = MagicMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_context.__aexit__ = AsyncMock(return_value=False)
+    
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.request.return_value = mock_context
+    mock_session.close = AsyncMock()
+    
+    mock_aiohttp = MagicMock()
+    mock_aiohttp.ClientSession.return_value = mock_session
+    
+    with patch("mcp_server_grist.client.aiohttp", mock_aiohttp):
+        client = GristClient(api_key="test_key", api_url="https://test.com/api", backend="aiohttp")
+        result = await client._request("GET", "/test")
+        await client.aclose()
+    
+    assert client.backend == "aiohttp"
+    assert result == {"data": "test"}
+    mock_session.request.assert_called_once()
+    mock_session.close.assert_called_once()
+
+
+def test_aiohttp_backend_falls_back_to_httpx():
+    """Teste le repli sur httpx lorsque aiohttp n'est pas installé."""
+    with patch("mcp_server_grist.client.aiohttp", None):
+        client = GristClient(api_key="test_key", api_url="https://test.com/api", backend="aiohttp")
+    
+    assert client.backend == "httpx"
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_cached(mock_env_vars):
+    """Teste que get_client retourne le même client pour une configuration donnée."""
+    assert get_client() is get_client()
+
+
+@pytest.mark.asyncio
+async def test_get_client_loads_dotenv_once(mock_env_vars, monkeypatch):
+    """Teste que le fichier .env n'est lu qu'au premier appel de get_client."""
+    monkeypatch.setattr("mcp_server_grist.client._dotenv_loaded", False)
+    with patch("mcp_server_grist.client.load_dotenv") as mock_load:
+        get_client()
+        get_client()
+    mock_load.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_list_orgs():
     """Teste la méthode list_orgs."""
@@ -172,4 +267,514 @@ async def test_add_records():
     with patch.object(client, "_request", AsyncMock(return_value=mock_response)):
         record_ids = await client.add_records("doc1", "table1", records)
         
-    assert record_ids == [1, 2]
\ No newline at end of file
+    assert record_ids == [1, 2]
+
+@pytest.mark.asyncio
+async def test_create_columns_batches_concurrent_calls():
+    """Teste que les créations de colonnes concurrentes sont fusionnées en un seul appel."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    mock_response = {"columns": [{"id": "A"}, {"id": "B"}, {"id": "C"}]}
+    
+    with patch.object(client, "_request", AsyncMock(return_value=mock_response)) as mock_request:
+        first, second = await asyncio.gather(
+            client.create_columns("doc1", "table1", {"columns": [{"id": "A"}]}),
+            client.create_columns("doc1", "table1", {"columns": [{"id": "B"}, {"id": "C"}]})
+        )
+    
+    mock_request.assert_called_once_with(
+        "POST",
+        "/docs/doc1/tables/table1/columns",
+        json_data={"columns": [{"id": "A"}, {"id": "B"}, {"id": "C"}]}
+    )
+    assert first == [{"id": "A"}]
+    assert second == [{"id": "B"}, {"id": "C"}]
+
+
+@pytest.mark.asyncio
+async def test_create_columns_batch_failure_retries_individually():
+    """Teste qu'un lot en échec est rejoué soumission par soumission."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        ids = [column["id"] for column in json_data["columns"]]
+        if "bad" in ids:
+            raise GristHTTPError(400, "invalid column")
+        return {"columns": [{"id": column_id} for column_id in ids]}
+    
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)):
+        good, bad = await asyncio.gather(
+            client.create_columns("doc1", "table1", {"columns": [{"id": "ok"}]}),
+            client.create_columns("doc1", "table1", {"columns": [{"id": "bad"}]}),
+            return_exceptions=True
+        )
+    
+    assert good == [{"id": "ok"}]
+    assert isinstance(bad, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_create_columns_batch_timeout_is_not_replayed():
+    """Teste qu'un lot interrompu (délai dépassé) n'est pas rejoué, pour ne pas dupliquer les colonnes."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=httpx.ReadTimeout("timeout"))) as mock_send:
+        first, second = await asyncio.gather(
+            client.create_columns("doc1", "table1", {"columns": [{"id": "A"}]}),
+            client.create_columns("doc1", "table1", {"columns": [{"id": "B"}]}),
+            return_exceptions=True
+        )
+    
+    mock_send.assert_called_once()
+    assert isinstance(first, ValueError) and "Request error" in str(first)
+    assert isinstance(second, ValueError) and "Request error" in str(second)
+
+
+@pytest.mark.asyncio
+async def test_download_table_schema_is_cached():
+    """Teste que le schéma d'une table est mémorisé entre deux appels."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    schema = {"name": "table1", "schema": {"fields": []}}
+    
+    with patch.object(client, "_send", AsyncMock(return_value=(200, {"ETag": '"v1"'}, json.dumps(schema).encode()))) as mock_send:
+        first = await client.download_table_schema("doc1", "Table1")
+        second = await client.download_table_schema("doc1", "Table1")
+    
+    assert first == schema
+    assert second == schema
+    mock_send.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_table_schema_revalidates_with_etag():
+    """Teste la revalidation par ETag d'une entrée expirée."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    schema = {"name": "table1", "schema": {"fields": []}}
+    client._cache.set(("schema", "doc1", "Table1", "label"), schema, etag='"v1"', ttl=0)
+    
+    with patch.object(client, "_send", AsyncMock(return_value=(304, {}, b""))) as mock_send:
+        result = await client.download_table_schema("doc1", "Table1")
+    
+    assert result == schema
+    assert mock_send.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.asyncio
+async def test_doc_mutation_invalidates_cache():
+    """Teste qu'une modification du document invalide ses métadonnées mémorisées."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    client._cache.set(("doc", "doc1"), {"name": "Doc"})
+    client._cache.set(("doc", "doc2"), {"name": "Autre"})
+    
+    with patch.object(client, "_send", AsyncMock(return_value=(200, {}, b""))):
+        await client.modify_doc("doc1", {"name": "Nouveau"})
+    
+    assert client._cache.get(("doc", "doc1")) is None
+    assert client._cache.get(("doc", "doc2")) == {"name": "Autre"}
+
+
+@pytest.mark.asyncio
+async def test_download_uses_shared_client():
+    """Teste que les téléchargements passent par le client HTTP persistant."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    def handler(request):
+        assert request.url.path == "/api/docs/doc1/download/csv"
+        assert request.headers["Authorization"] == "Bearer test_key"
+        return httpx.Response(200, content=b"a,b\n1,2\n")
+    
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    content = await client.download_doc_csv("doc1", "Table1")
+    await client.aclose()
+    
+    assert content == "a,b\n1,2\n"
+
+
+@pytest.mark.asyncio
+async def test_download_csv_uses_response_charset():
+    """Teste que le CSV est décodé selon le jeu de caractères de la réponse, sans échouer sur un octet invalide."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    bodies = iter([
+        ("text/csv; charset=latin-1", "nom\nCéline\n".encode("latin-1")),
+        ("text/csv", b"nom\nC\xe9line\n")
+    ])
+    
+    def handler(request):
+        content_type, body = next(bodies)
+        return httpx.Response(200, headers={"Content-Type": content_type}, content=body)
+    
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    latin = await client.download_doc_csv("doc1", "Table1")
+    invalid = await client.download_doc_csv("doc1", "Table1")
+    await client.aclose()
+    
+    assert latin == "nom\nCéline\n"
+    assert invalid == "nom\nC\ufffdline\n"
+
+
+@pytest.mark.asyncio
+async def test_upload_attachments_invalidates_cache():
+    """Teste que le téléversement de pièces jointes invalide le cache du document."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    client._cache.set(("attachments", "doc1"), {"records": []})
+    client._cache.set(("doc", "doc2"), {"name": "Autre"})
+    
+    def handler(request):
+        assert request.url.path == "/api/docs/doc1/attachments"
+        return httpx.Response(200, json=[7])
+    
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ids = await client.upload_attachments("doc1", [("a.txt", b"a", "text/plain")])
+    await client.aclose()
+    
+    assert ids == [7]
+    assert client._cache.get(("attachments", "doc1")) is None
+    assert client._cache.get(("doc", "doc2")) == {"name": "Autre"}
+
+
+@pytest.mark.asyncio
+async def test_download_http_error():
+    """Teste qu'un statut d'erreur lors d'un téléchargement est signalé."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    client._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(404, content=b"Not found"))
+    )
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download_doc("doc1")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_serializes_body():
+    """Teste que le corps JSON est sérialisé avant l'envoi."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    def handler(request):
+        assert json.loads(request.content) == {"records": [{"fields": {"name": "é"}}]}
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, content=b'{"records": [{"id": 1}]}')
+    
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = await client._request("POST", "/test", json_data={"records": [{"fields": {"name": "é"}}]})
+    await client.aclose()
+    
+    assert result == {"records": [{"id": 1}]}
+
+
+def test_json_helpers_without_orjson():
+    """Teste le repli sur le module json standard."""
+    from mcp_server_grist import client as client_module
+    
+    with patch.object(client_module, "orjson", None):
+        body = client_module._json_dumps({"a": 1})
+        assert client_module._json_loads(body) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_sql_query_cache_invalidated_by_mutation():
+    """Teste que les résultats SQL mémorisés sont invalidés après une mutation."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    with patch.object(client, "_send", AsyncMock(return_value=(200, {}, b'{"records": []}'))):
+        await client.sql_query("doc1", "SELECT  *\n FROM Table1", cache_ttl=30.0)
+        assert client.cached_sql_result("doc1", "SELECT * FROM Table1") == {"records": []}
+        assert client.cached_sql_result("doc1", "select * from Table1") is None
+        
+        await client.delete_records("doc1", "Table1", [1])
+    
+    assert client.cached_sql_result("doc1", "SELECT * FROM Table1") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_are_coalesced():
+    """Teste que des lectures identiques concurrentes partagent une seule requête."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    async def slow_send(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return 200, {}, b'{"records": [{"id": 1}]}'
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=slow_send)) as mock_send:
+        results = await asyncio.gather(
+            client.sql_query("doc1", "SELECT * FROM Table1"),
+            client.sql_query("doc1", "SELECT * FROM Table1"),
+            client.download_table_schema("doc1", "Table1"),
+            client.download_table_schema("doc1", "Table1")
+        )
+    
+    assert results[0] == results[1] == {"records": [{"id": 1}]}
+    assert mock_send.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_read_failure_is_not_retained():
+    """Teste qu'un échec partagé n'est pas conservé pour les appels suivants."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=[(500, {}, b"boom"), (200, {}, b'{"records": []}')])):
+        with pytest.raises(ValueError, match="HTTP error: 500"):
+            await client.sql_query("doc1", "SELECT * FROM Table1")
+        assert await client.sql_query("doc1", "SELECT * FROM Table1") == {"records": []}
+
+
+def test_http2_requires_h2():
+    """Teste que HTTP/2 n'est activé que si h2 est installé."""
+    with patch("mcp_server_grist.client._HTTP2_AVAILABLE", False):
+        client = GristClient(api_key="test_key", api_url="https://test.com/api", http2=True)
+    assert client.http2 is False
+    
+    with patch("mcp_server_grist.client._HTTP2_AVAILABLE", True):
+        client = GristClient(api_key="test_key", api_url="https://test.com/api", http2=True)
+    assert client.http2 is True
+
+
+@pytest.mark.asyncio
+async def test_get_client_pool_size_from_env(mock_env_vars, monkeypatch):
+    """Teste que la taille du pool de connexions est lue dans l'environnement."""
+    monkeypatch.setenv("GRIST_MAX_CONNECTIONS", "128")
+    client = get_client()
+    assert client.max_connections == 128
+
+    monkeypatch.setenv("GRIST_MAX_CONNECTIONS", "beaucoup")
+    assert get_client().max_connections is None
+
+
+@pytest.mark.asyncio
+async def test_validate_formula_syntax():
+    """Teste la détection des références de colonnes dans une formule."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    columns = [
+        GristColumn(id="Prix", fields={"label": "Prix", "type": "Numeric"}),
+        GristColumn(id="Quantite", fields={"label": "Quantité", "type": "Int"})
+    ]
+    
+    with patch.object(client, "list_columns", AsyncMock(return_value=columns)):
+        valid = await client.validate_formula_syntax("doc1", "Table1", "$Prix * $Quantite")
+        invalid = await client.validate_formula_syntax("doc1", "Table1", "$prix * $Inconnu")
+    
+    assert valid["valid"] is True
+    assert invalid["valid"] is False
+    assert [issue["type"] for issue in invalid["issues"]] == ["case_error", "unknown_column"]
+    assert invalid["corrected_formula"] == "$Prix * $Inconnu"
+
+
+@pytest.mark.asyncio
+async def test_validate_formula_syntax_corrects_whole_references():
+    """Teste que la correction de casse ne modifie pas les références plus longues."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    columns = [
+        GristColumn(id="Prix", fields={"label": "Prix"}),
+        GristColumn(id="PrixHT", fields={"label": "Prix HT"})
+    ]
+    
+    with patch.object(client, "list_columns", AsyncMock(return_value=columns)):
+        result = await client.validate_formula_syntax("doc1", "Table1", "$prix + $prixHT + $PrixHT")
+    
+    assert result["corrected_formula"] == "$Prix + $PrixHT + $PrixHT"
+
+
+@pytest.mark.asyncio
+async def test_add_records_large_insert_is_chunked():
+    """Teste que les insertions volumineuses sont découpées en plusieurs requêtes."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    records = [{"name": f"Record {i}"} for i in range(1200)]
+    
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        chunk = json_data["records"]
+        first = int(chunk[0]["fields"]["name"].split()[1])
+        return {"records": [{"id": first + i + 1} for i in range(len(chunk))]}
+    
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)) as mock_request:
+        record_ids = await client.add_records("doc1", "Table1", records)
+    
+    assert mock_request.call_count == 3
+    assert [len(call.kwargs["json_data"]["records"]) for call in mock_request.call_args_list] == [500, 500, 200]
+    assert record_ids == list(range(1, 1201))
+
+
+@pytest.mark.asyncio
+async def test_add_records_chunk_failure_reports_inserted_ids():
+    """Teste qu'un bloc en échec signale les IDs des blocs déjà insérés, sans envoyer les suivants."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    records = [{"name": f"Record {i}"} for i in range(1200)]
+    
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        chunk = json_data["records"]
+        first = int(chunk[0]["fields"]["name"].split()[1])
+        if first == 500:
+            raise GristHTTPError(400, "invalid record")
+        return {"records": [{"id": first + i + 1} for i in range(len(chunk))]}
+    
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)) as mock_request:
+        with pytest.raises(PartialInsertError) as excinfo:
+            await client.add_records("doc1", "Table1", records)
+    
+    assert mock_request.call_count == 2
+    assert excinfo.value.record_ids == list(range(1, 501))
+
+
+@pytest.mark.asyncio
+async def test_add_records_batches_concurrent_calls():
+    """Teste que des insertions concurrentes dans une même table sont fusionnées."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        return {"records": [{"id": i + 1} for i in range(len(json_data["records"]))]}
+
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)) as mock_request:
+        first, second = await asyncio.gather(
+            client.add_records("doc1", "Table1", [{"name": "A"}]),
+            client.add_records("doc1", "Table1", [{"name": "B"}, {"name": "C"}]),
+        )
+
+    mock_request.assert_called_once()
+    assert first == [1]
+    assert second == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_add_records_batches_only_same_fields():
+    """Teste que des insertions portant sur des colonnes différentes ne sont pas fusionnées."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        return {"records": [{"id": i + 1} for i in range(len(json_data["records"]))]}
+
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)) as mock_request:
+        await asyncio.gather(
+            client.add_records("doc1", "Table1", [{"a": 1}]),
+            client.add_records("doc1", "Table1", [{"b": 2}]),
+        )
+
+    bodies = [call.kwargs["json_data"] for call in mock_request.call_args_list]
+    assert len(bodies) == 2
+    assert {"records": [{"fields": {"a": 1}}]} in bodies
+    assert {"records": [{"fields": {"b": 2}}]} in bodies
+
+
+@pytest.mark.asyncio
+async def test_add_records_batch_timeout_is_not_replayed():
+    """Teste qu'une insertion groupée interrompue n'est pas rejouée, pour ne pas dupliquer les lignes."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    posts = []
+    
+    def handler(request):
+        posts.append(request)
+        raise httpx.ReadTimeout("timeout", request=request)
+    
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    results = await asyncio.gather(
+        client.add_records("doc1", "Table1", [{"name": "A"}]),
+        client.add_records("doc1", "Table1", [{"name": "B"}]),
+        return_exceptions=True
+    )
+    await client.aclose()
+    
+    assert len(posts) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_list_columns_cached_until_column_mutation():
+    """Teste que la liste des colonnes est mémorisée puis invalidée par une mutation."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    columns_body = b'{"columns": [{"id": "nom", "fields": {"label": "Nom"}}]}'
+    responses = [
+        (200, {}, columns_body),
+        (200, {}, b'{"columns": [{"id": "age"}]}'),
+        (200, {}, columns_body)
+    ]
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=responses)) as mock_send:
+        first = await client.list_columns("doc1", "Table1")
+        second = await client.list_columns("doc1", "Table1")
+        assert mock_send.call_count == 1
+        
+        await client.create_columns("doc1", "Table1", {"columns": [{"id": "age"}]})
+        await client.list_columns("doc1", "Table1")
+    
+    assert [col.id for col in first] == ["nom"]
+    assert [col.id for col in second] == ["nom"]
+    assert mock_send.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_validate_columns_refetches_before_rejecting():
+    """Teste qu'une colonne absente du cache est recherchée une fois sur le serveur avant refus."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    responses = [
+        (200, {}, b'{"columns": [{"id": "nom", "fields": {}}]}'),
+        (200, {}, b'{"columns": [{"id": "nom", "fields": {}}, {"id": "age", "fields": {}}]}')
+    ]
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=responses)) as mock_send:
+        await client.list_columns("doc1", "Table1")
+        assert (await client.validate_columns_exist("doc1", "Table1", ["nom"]))["valid"]
+        assert mock_send.call_count == 1
+        
+        # Colonne ajoutée depuis l'interface Grist, inconnue du cache
+        result = await client.validate_columns_exist("doc1", "Table1", ["nom", "age"])
+    
+    assert result["valid"]
+    assert mock_send.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_read_started_before_mutation_is_not_reused():
+    """Teste qu'une lecture lancée avant une mutation n'est ni partagée ni mémorisée après celle-ci."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    release_old_read = asyncio.Event()
+    column_reads = []
+    
+    async def fake_send(method, url, json_data=None, params=None, headers=None):
+        if method == "POST":
+            return 200, {}, b'{"columns": [{"id": "age"}]}'
+        column_reads.append(url)
+        if len(column_reads) == 1:
+            await release_old_read.wait()
+            return 200, {}, b'{"columns": [{"id": "nom"}]}'
+        return 200, {}, b'{"columns": [{"id": "nom"}, {"id": "age"}]}'
+    
+    with patch.object(client, "_send", AsyncMock(side_effect=fake_send)):
+        old_read = asyncio.ensure_future(client.list_columns("doc1", "Table1"))
+        await asyncio.sleep(0)
+        await client.create_columns("doc1", "Table1", {"columns": [{"id": "age"}]})
+        
+        try:
+            # Ne doit pas attendre la lecture antérieure à la mutation
+            after = await asyncio.wait_for(client.list_columns("doc1", "Table1"), timeout=1.0)
+        finally:
+            release_old_read.set()
+        before = await old_read
+        cached = await client.list_columns("doc1", "Table1")
+    
+    assert [col.id for col in before] == ["nom"]
+    assert [col.id for col in after] == ["nom", "age"]
+    assert [col.id for col in cached] == ["nom", "age"]
+    assert len(column_reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_sql_result_in_flight_during_mutation_is_not_cached():
+    """Teste qu'un résultat SQL obtenu pendant une insertion n'est pas mémorisé."""
+    client = GristClient(api_key="test_key", api_url="https://test.com/api")
+    release_query = asyncio.Event()
+    
+    async def fake_request(method, endpoint, json_data=None, params=None):
+        if endpoint.endswith("/sql"):
+            await release_query.wait()
+            return {"records": [{"fields": {"name": "A"}}]}
+        client._invalidate_doc_cache(endpoint)
+        return {"records": [{"id": 2}]}
+    
+    with patch.object(client, "_request", AsyncMock(side_effect=fake_request)):
+        query = asyncio.ensure_future(
+            client.sql_query("doc1", "SELECT * FROM Table1", cache_ttl=30.0)
+        )
+        await asyncio.sleep(0)
+        await client.add_records("doc1", "Table1", [{"name": "B"}])
+        release_query.set()
+        await query
+    
+    assert client.cached_sql_result("doc1", "SELECT * FROM Table1") is None
@@ -0,0 +1,116 @@
+"""
+Tests pour les outils de requêtes SQL.
+
+Ce module teste les outils MCP d'exécution de requêtes SQL sur Grist.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mcp_server_grist.tools.queries import execute_sql_query, filter_sql_query
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query(mock_grist_client, mock_ctx):
+    """Teste l'outil execute_sql_query."""
+    mock_grist_client.cached_sql_result.return_value = None
+    mock_grist_client.sql_query.return_value = {
+        "statement": "SELECT * FROM Table1",
+        "records": [{"fields": {"name": "A"}}]
+    }
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await execute_sql_query("doc1", "  SELECT * FROM Table1; ", ctx=mock_ctx)
+    
+    assert result["success"] is True
+    assert result["record_count"] == 1
+    assert result["query"] == "SELECT * FROM Table1"
+    assert result["cached"] is False
+    mock_grist_client.sql_query.assert_called_once_with(
+        "doc1", "SELECT * FROM Table1", None, timeout_ms=1000, cache_ttl=30.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_cache_hit(mock_grist_client, mock_ctx):
+    """Teste qu'un résultat mémorisé est retourné sans appel à l'API."""
+    mock_grist_client.cached_sql_result.return_value = {"records": [{"id": 1, "fields": {}}]}
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await execute_sql_query("doc1", "SELECT * FROM Table1", ctx=mock_ctx)
+    
+    assert result["success"] is True
+    assert result["cached"] is True
+    mock_grist_client.sql_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_without_cache(mock_grist_client, mock_ctx):
+    """Teste que use_cache=False ignore et n'alimente pas le cache."""
+    mock_grist_client.sql_query.return_value = {"records": []}
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await execute_sql_query("doc1", "SELECT * FROM Table1", use_cache=False, ctx=mock_ctx)
+    
+    assert result["cached"] is False
+    mock_grist_client.cached_sql_result.assert_not_called()
+    assert mock_grist_client.sql_query.call_args.kwargs["cache_ttl"] is None
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_rejects_non_select(mock_grist_client, mock_ctx):
+    """Teste que les requêtes autres que SELECT sont refusées."""
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await execute_sql_query("doc1", "DELETE FROM Table1", ctx=mock_ctx)
+    
+    assert result["success"] is False
+    mock_grist_client.sql_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_filter_sql_query(mock_grist_client, mock_ctx):
+    """Teste que filter_sql_query génère une requête paramétrée et l'exécute."""
+    mock_grist_client.cached_sql_result.return_value = None
+    mock_grist_client.sql_query.return_value = {"records": [{"fields": {"status": "actif"}}]}
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await filter_sql_query(
+            "doc1", "Table1",
+            columns=["nom"],
+            where_conditions={"status": "actif"},
+            limit=5,
+            ctx=mock_ctx
+        )
+    
+    assert result["success"] is True
+    assert result["query"] == 'SELECT "nom" FROM "Table1" WHERE "status" = ? LIMIT 5'
+    mock_grist_client.sql_query.assert_called_once_with(
+        "doc1", 'SELECT "nom" FROM "Table1" WHERE "status" = ? LIMIT 5', ["actif"],
+        timeout_ms=1000, cache_ttl=30.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_filter_sql_query_without_cache(mock_grist_client, mock_ctx):
+    """Teste que filter_sql_query transmet use_cache=False pour forcer une lecture fraîche."""
+    mock_grist_client.sql_query.return_value = {"records": []}
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await filter_sql_query("doc1", "Table1", use_cache=False, ctx=mock_ctx)
+    
+    assert result["cached"] is False
+    mock_grist_client.cached_sql_result.assert_not_called()
+    assert mock_grist_client.sql_query.call_args.kwargs["cache_ttl"] is None
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_does_not_mutate_cached_result(mock_grist_client, mock_ctx):
+    """Teste que l'ajout des IDs ne modifie pas le résultat mémorisé."""
+    cached = {"records": [{"fields": {"name": "A"}}]}
+    mock_grist_client.cached_sql_result.return_value = cached
+    
+    with patch("mcp_server_grist.tools.queries.get_client", return_value=mock_grist_client):
+        result = await execute_sql_query("doc1", "SELECT * FROM Table1", ctx=mock_ctx)
+    
+    assert result["records"] == [{"fields": {"name": "A"}, "id": 1}]
+    assert cached == {"records": [{"fields": {"name": "A"}}]}
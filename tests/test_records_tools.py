@@ -4,9 +4,12 @@ Tests pour les outils de gestion des enregistrements MCP.
 Ce module teste les outils MCP pour la manipulation des enregistrements Grist.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from mcp_server_grist.client import PartialInsertError
 from mcp_server_grist.tools.records import (
     add_grist_records,
     add_grist_records_safe,
@@ -66,6 +69,18 @@ async def test_add_grist_records_error(mock_grist_client, mock_ctx):
     assert result["record_ids"] == []
 
 
+@pytest.mark.asyncio
+async def test_add_grist_records_partial_insert(mock_grist_client, mock_ctx):
+    """Teste que les IDs déjà insérés sont retournés si l'insertion découpée est interrompue."""
+    mock_grist_client.add_records.side_effect = PartialInsertError([1, 2], ValueError("Request error: timeout"))
+    
+    with patch("mcp_server_grist.tools.records.get_client", return_value=mock_grist_client):
+        result = await add_grist_records("doc1", "Table1", [{"name": "A"}], mock_ctx)
+    
+    assert result["success"] is False
+    assert result["record_ids"] == [1, 2]
+
+
 @pytest.mark.asyncio
 async def test_add_grist_records_safe_success(mock_grist_client, mock_ctx):
     """Teste l'outil add_grist_records_safe avec succès."""
@@ -212,3 +227,29 @@ async def test_delete_grist_records_invalid_id(mock_grist_client, mock_ctx):
     
     # Vérifier que la méthode n'a pas été appelée
     mock_grist_client.delete_records.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_grist_records_safe_runs_validations_concurrently(mock_grist_client, mock_ctx):
+    """Teste que les validations de table et de colonnes sont lancées ensemble."""
+    started = []
+    
+    async def validate_table(*args):
+        started.append("table")
+        await asyncio.sleep(0)
+        assert "columns" in started
+        return {"exists": True}
+    
+    async def validate_columns(*args):
+        started.append("columns")
+        return {"valid": True}
+    
+    mock_grist_client.validate_table_exists.side_effect = validate_table
+    mock_grist_client.validate_columns_exist.side_effect = validate_columns
+    mock_grist_client.add_records.return_value = [1]
+    
+    with patch("mcp_server_grist.tools.records.get_client", return_value=mock_grist_client):
+        result = await add_grist_records_safe("doc1", "table1", [{"name": "Test"}], mock_ctx)
+    
+    assert result["success"] is True
+    assert started == ["table", "columns"]
@@ -0,0 +1,21 @@
+"""
+Tests pour la configuration du serveur MCP.
+
+Ce module teste le cycle de vie du serveur et la fermeture des clients partagés.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from mcp_server_grist.server import grist_lifespan
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_clients_after_last_session():
+    """Teste que les clients partagés ne sont fermés qu'à la sortie du dernier cycle de vie."""
+    with patch("mcp_server_grist.server.close_clients", AsyncMock()) as mock_close:
+        async with grist_lifespan(None):
+            async with grist_lifespan(None):
+                pass
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()